@@ -1,7 +1,7 @@
 import sys
 from pathlib import Path
 from logging.config import fileConfig
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, pool, text
 from alembic import context
 
 # Add project root to path
@@ -26,6 +26,35 @@ config.set_main_option("sqlalchemy.url", sync_db_url)
 # Set target metadata for autogenerate
 target_metadata = Base.metadata
 
+# Columns rewritten on (nearly) every UPDATE. Indexing them would make each of
+# those UPDATEs insert fresh index entries and lose PostgreSQL's HOT path.
+# active_leads_count moves on every assignment, so it stays out of indexes too.
+HOT_MUTABLE_COLUMNS = {"updated_at", "active_leads_count"}
+
+
+def _indexed_column_names(index):
+    # INCLUDE columns are stored in the index as well and block HOT the same way
+    yield from (column.name for column in index.columns)
+    for column in index.dialect_options["postgresql"]["include"] or ():
+        yield column if isinstance(column, str) else column.name
+
+
+def check_hot_safe_indexes(metadata):
+    offending = [
+        f"{table.name}.{index.name}"
+        for table in metadata.tables.values()
+        for index in table.indexes
+        if HOT_MUTABLE_COLUMNS.intersection(_indexed_column_names(index))
+    ]
+    if offending:
+        raise RuntimeError(
+            f"Indexes on per-update columns {sorted(HOT_MUTABLE_COLUMNS)} defeat HOT updates: "
+            f"{', '.join(offending)}"
+        )
+
+
+check_hot_safe_indexes(target_metadata)
+
 
 def run_migrations_offline():
     url = config.get_main_option("sqlalchemy.url")
@@ -40,21 +69,43 @@ def run_migrations_offline():
         context.run_migrations()
 
 
+def do_run_migrations(connection):
+    # Optional tenant schema: `alembic -x schema=tenant_a upgrade head`
+    schema = context.get_x_argument(as_dictionary=True).get("schema")
+    if schema:
+        quoted = connection.dialect.identifier_preparer.quote_schema(schema)
+        connection.execute(text(f"SET search_path TO {quoted}"))
+        # The SET autobegins a transaction; left open, Alembic would treat it
+        # as the caller's and never commit the migrations run inside it.
+        connection.commit()
+
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
 def run_migrations_online():
+    # Batch runners can hand in an open connection via config.attributes so a
+    # single engine serves every command.upgrade() call instead of paying a
+    # fresh connection handshake per run.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args={"application_name": "alembic"},
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+        do_run_migrations(connection)
 
 
 if context.is_offline_mode():
@@ -0,0 +1,39 @@
+"""add brin indexes on history timestamps
+
+Revision ID: 0077b86dc59f
+Revises: a3fbb6116cde
+Create Date: 2026-10-16 10:41:53.617402
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0077b86dc59f'
+down_revision = 'a3fbb6116cde'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Append-only audit tables: rows arrive in timestamp order, so a BRIN
+    # block-range summary serves time-window scans at a fraction of a btree's size.
+    op.create_index(
+        'brin_conversion_history_changed_at', 'lead_conversion_history', ['changed_at'],
+        postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'brin_lead_activities_activity_at', 'lead_activities', ['activity_at'],
+            postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'brin_lead_activities_activity_at', table_name='lead_activities',
+            postgresql_concurrently=True, if_exists=True,
+        )
+    op.drop_index('brin_conversion_history_changed_at', table_name='lead_conversion_history')
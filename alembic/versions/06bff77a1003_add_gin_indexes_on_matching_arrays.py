@@ -0,0 +1,41 @@
+"""add gin indexes on matching arrays
+
+Revision ID: 06bff77a1003
+Revises: 23946ab7821f
+Create Date: 2026-10-16 15:31:08.772410
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '06bff77a1003'
+down_revision = '23946ab7821f'
+branch_labels = None
+depends_on = None
+
+
+GIN_INDEXES = (
+    ('ix_agents_spec_property_type_gin', 'agents', 'specialization_property_type'),
+    ('ix_agents_spec_areas_gin', 'agents', 'specialization_areas'),
+    ('ix_agents_language_skills_gin', 'agents', 'language_skills'),
+    ('ix_leads_preferred_areas_gin', 'leads', 'preferred_areas'),
+)
+
+
+def upgrade() -> None:
+    # Array containment/overlap (@>, &&) between lead preferences and agent
+    # specializations can use these instead of scanning every row. Built
+    # CONCURRENTLY so lead capture keeps writing while they build.
+    with op.get_context().autocommit_block():
+        for name, table, column in GIN_INDEXES:
+            op.create_index(
+                name, table, [column], unique=False,
+                postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(GIN_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,29 @@
+"""add partial converted history index
+
+Revision ID: 093468f8a6c1
+Revises: 705b57c71480
+Create Date: 2026-10-16 11:31:08.442957
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '093468f8a6c1'
+down_revision = '705b57c71480'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Conversion reports only ever join the 'converted' history rows; a partial
+    # index over just those stays a small fraction of the table.
+    op.create_index(
+        'ix_conversion_history_converted', 'lead_conversion_history', ['lead_id', 'changed_at'],
+        postgresql_where=sa.text("status_to = 'converted'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_conversion_history_converted', table_name='lead_conversion_history')
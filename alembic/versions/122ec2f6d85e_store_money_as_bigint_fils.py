@@ -0,0 +1,54 @@
+"""store money as bigint fils
+
+Revision ID: 122ec2f6d85e
+Revises: 06bff77a1003
+Create Date: 2026-10-16 15:52:19.381046
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '122ec2f6d85e'
+down_revision = '06bff77a1003'
+branch_labels = None
+depends_on = None
+
+
+MONEY_COLUMNS = {
+    'leads': ('budget_min', 'budget_max'),
+    'agent_performance_metrics': ('average_deal_size',),
+}
+
+
+def upgrade() -> None:
+    # NUMERIC(15,2) -> BIGINT fils. The type change rewrites each table under
+    # ACCESS EXCLUSIVE, so all of a table's columns go in one ALTER (one
+    # rewrite); run off-peak. ck_budget_range follows the renamed columns and
+    # is re-checked during the rewrite.
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    for table, columns in MONEY_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, new_column_name=f'{column}_fils')
+        op.execute(f'ALTER TABLE {table} ' + ', '.join(
+            f'ALTER COLUMN {column}_fils TYPE BIGINT USING round({column}_fils * 100)::bigint'
+            for column in columns
+        ))
+
+    # Converted deal amount the revenue analytics aggregate over
+    op.add_column('lead_conversion_history', sa.Column('deal_value_fils', sa.BigInteger(), nullable=True))
+
+    op.execute('ANALYZE leads, agent_performance_metrics')
+
+
+def downgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.drop_column('lead_conversion_history', 'deal_value_fils')
+    for table, columns in MONEY_COLUMNS.items():
+        op.execute(f'ALTER TABLE {table} ' + ', '.join(
+            f'ALTER COLUMN {column}_fils TYPE NUMERIC(15, 2) USING {column}_fils / 100.0'
+            for column in columns
+        ))
+        for column in columns:
+            op.alter_column(table, f'{column}_fils', new_column_name=column)
@@ -0,0 +1,80 @@
+"""validate lead status transitions in db
+
+Revision ID: 23946ab7821f
+Revises: 7a50877b0bea
+Create Date: 2026-10-16 15:04:33.610275
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '23946ab7821f'
+down_revision = '7a50877b0bea'
+branch_labels = None
+depends_on = None
+
+
+# Snapshot of app.constants.ALLOWED_TRANSITIONS at the time of this revision
+TRANSITIONS = (
+    ('new', 'contacted'),
+    ('new', 'lost'),
+    ('contacted', 'qualified'),
+    ('contacted', 'lost'),
+    ('qualified', 'viewing_scheduled'),
+    ('qualified', 'lost'),
+    ('viewing_scheduled', 'negotiation'),
+    ('viewing_scheduled', 'qualified'),
+    ('viewing_scheduled', 'lost'),
+    ('negotiation', 'converted'),
+    ('negotiation', 'lost'),
+)
+
+CHECK_TRANSITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION check_lead_transition()
+RETURNS trigger AS $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM lead_status_transitions
+        WHERE from_status = OLD.status AND to_status = NEW.status
+    ) THEN
+        RAISE EXCEPTION 'Invalid transition: % -> %', OLD.status, NEW.status
+            USING ERRCODE = 'check_violation';
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    lead_status = postgresql.ENUM(name='lead_status', create_type=False)
+    transitions = op.create_table('lead_status_transitions',
+    sa.Column('from_status', lead_status, nullable=False),
+    sa.Column('to_status', lead_status, nullable=False),
+    sa.PrimaryKeyConstraint('from_status', 'to_status')
+    )
+    op.bulk_insert(transitions, [
+        {'from_status': from_status, 'to_status': to_status}
+        for from_status, to_status in TRANSITIONS
+    ])
+
+    # Validates every status UPDATE set-at-a-time inside Postgres, including
+    # bulk UPDATEs that never pass through the ORM. The WHEN clause keeps
+    # updates that leave status alone from calling the function at all.
+    op.execute(CHECK_TRANSITION_FUNCTION)
+    op.execute("""
+        CREATE TRIGGER trg_leads_status_transition
+        BEFORE UPDATE OF status ON leads
+        FOR EACH ROW
+        WHEN (OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION check_lead_transition()
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER trg_leads_status_transition ON leads')
+    op.execute('DROP FUNCTION check_lead_transition()')
+    op.drop_table('lead_status_transitions')
@@ -0,0 +1,36 @@
+"""set null conversion history agent fk
+
+Revision ID: 705b57c71480
+Revises: 0077b86dc59f
+Create Date: 2026-10-16 11:02:37.184265
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '705b57c71480'
+down_revision = '0077b86dc59f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # lead_conversion_history is partitioned, and PostgreSQL cannot add a
+    # NOT VALID foreign key to a partitioned table, so the swap happens in one
+    # transaction. Fail fast instead of queueing live inserts behind the lock.
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.drop_constraint('lead_conversion_history_agent_id_fkey', 'lead_conversion_history', type_='foreignkey')
+    op.create_foreign_key(
+        'lead_conversion_history_agent_id_fkey', 'lead_conversion_history', 'agents',
+        ['agent_id'], ['agent_id'], ondelete='SET NULL',
+    )
+
+
+def downgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.drop_constraint('lead_conversion_history_agent_id_fkey', 'lead_conversion_history', type_='foreignkey')
+    op.create_foreign_key(
+        'lead_conversion_history_agent_id_fkey', 'lead_conversion_history', 'agents',
+        ['agent_id'], ['agent_id'],
+    )
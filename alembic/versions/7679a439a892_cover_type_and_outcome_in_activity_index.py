@@ -0,0 +1,38 @@
+"""cover type and outcome in activity index
+
+Revision ID: 7679a439a892
+Revises: 8bacb6902c29
+Create Date: 2026-10-16 17:20:56.048213
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7679a439a892'
+down_revision = '8bacb6902c29'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The follow-up timing report walks every lead's activities in
+    # (lead_id, activity_at) order and reads outcome; with type and outcome in
+    # the leaf pages that walk is index-only. lead_activities is partitioned,
+    # which rules out CONCURRENTLY on the parent: the swap runs in one
+    # transaction and blocks writes to the table while the index builds.
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.drop_index('ix_lead_activities_lead_id_at', table_name='lead_activities')
+    op.create_index(
+        'ix_lead_activities_lead_id_at', 'lead_activities', ['lead_id', 'activity_at'],
+        postgresql_include=['type', 'outcome'],
+    )
+    # VACUUM sets the visibility map bits that index-only scans depend on.
+    with op.get_context().autocommit_block():
+        op.execute('VACUUM (ANALYZE) lead_activities')
+
+
+def downgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.drop_index('ix_lead_activities_lead_id_at', table_name='lead_activities')
+    op.create_index('ix_lead_activities_lead_id_at', 'lead_activities', ['lead_id', 'activity_at'])
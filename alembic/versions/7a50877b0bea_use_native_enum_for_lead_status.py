@@ -0,0 +1,67 @@
+"""use native enum for lead status
+
+Revision ID: 7a50877b0bea
+Revises: e4bee8d5be4e
+Create Date: 2026-10-16 14:36:51.274918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7a50877b0bea'
+down_revision = 'e4bee8d5be4e'
+branch_labels = None
+depends_on = None
+
+
+LEAD_STATUSES = ('new', 'contacted', 'qualified', 'viewing_scheduled', 'negotiation', 'converted', 'lost')
+
+STATUS_COLUMNS = (
+    ('leads', 'status'),
+    ('lead_conversion_history', 'status_from'),
+    ('lead_conversion_history', 'status_to'),
+)
+
+
+def _create_converted_index() -> None:
+    # The type change would otherwise rebuild this partial index with its
+    # predicate cast through text; recreated afterwards it compares against
+    # the column's own type.
+    op.create_index(
+        'ix_conversion_history_converted', 'lead_conversion_history', ['lead_id', 'changed_at'],
+        postgresql_where=sa.text("status_to = 'converted'"),
+    )
+
+
+def upgrade() -> None:
+    # Each ALTER rewrites its table (and, for the partitioned history table,
+    # every partition) under ACCESS EXCLUSIVE; run off-peak.
+    values = ', '.join(f"'{status}'" for status in LEAD_STATUSES)
+    op.execute(f'CREATE TYPE lead_status AS ENUM ({values})')
+
+    # The enum enforces the value set the CHECK used to
+    op.drop_constraint('ck_lead_status', 'leads', type_='check')
+    op.execute('ALTER TABLE leads ALTER COLUMN status DROP DEFAULT')
+    op.drop_index('ix_conversion_history_converted', table_name='lead_conversion_history')
+    for table, column in STATUS_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE lead_status USING {column}::lead_status')
+    op.execute("ALTER TABLE leads ALTER COLUMN status SET DEFAULT 'new'")
+    _create_converted_index()
+
+    op.execute('ANALYZE leads, lead_conversion_history')
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE leads ALTER COLUMN status DROP DEFAULT')
+    op.drop_index('ix_conversion_history_converted', table_name='lead_conversion_history')
+    for table, column in STATUS_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(50) USING {column}::text')
+    op.execute("ALTER TABLE leads ALTER COLUMN status SET DEFAULT 'new'")
+    _create_converted_index()
+    op.create_check_constraint(
+        'ck_lead_status', 'leads',
+        "status IN ('new', 'contacted', 'qualified', 'viewing_scheduled', 'negotiation', 'converted', 'lost')",
+    )
+    op.execute('DROP TYPE lead_status')
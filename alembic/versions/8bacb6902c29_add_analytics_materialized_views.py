@@ -0,0 +1,78 @@
+"""add analytics materialized views
+
+Revision ID: 8bacb6902c29
+Revises: c8b9fcf4f56f
+Create Date: 2026-10-16 16:48:05.127733
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8bacb6902c29'
+down_revision = 'c8b9fcf4f56f'
+branch_labels = None
+depends_on = None
+
+
+# (view, unique key columns, body). The unique index on each view's grouping
+# key is what allows REFRESH MATERIALIZED VIEW CONCURRENTLY.
+VIEWS = (
+    ('mv_monthly_lead_trends', ('month',), """
+        SELECT
+            DATE_TRUNC('month', created_at) as month,
+            COUNT(*) as lead_volume,
+            COUNT(CASE WHEN status = 'converted' THEN 1 END) as converted_volume
+        FROM leads
+        GROUP BY DATE_TRUNC('month', created_at)
+    """),
+    ('mv_source_quality_monthly', ('source_type', 'month'), """
+        SELECT
+            source_type,
+            DATE_TRUNC('month', created_at) as month,
+            ROUND(AVG(score), 2) as avg_score,
+            COUNT(*) as lead_count,
+            COUNT(CASE WHEN status = 'converted' THEN 1 END) as converted_count
+        FROM leads
+        GROUP BY source_type, DATE_TRUNC('month', created_at)
+    """),
+    ('mv_revenue_by_source', ('source_type',), """
+        SELECT
+            l.source_type,
+            COALESCE(SUM(lch.deal_value_fils) / 100.0, 0) as total_revenue,
+            COUNT(DISTINCT l.lead_id) as converted_leads,
+            ROUND(AVG(lch.deal_value_fils) / 100.0, 2) as average_deal_size
+        FROM leads l
+        JOIN lead_conversion_history lch ON l.lead_id = lch.lead_id
+        WHERE lch.status_to = 'converted'
+        AND lch.deal_value_fils IS NOT NULL
+        GROUP BY l.source_type
+    """),
+    ('mv_conversion_rates_src_agent', ('source_type', 'agent_id'), """
+        SELECT
+            l.source_type,
+            la.agent_id,
+            a.full_name as agent_name,
+            ROUND(
+                (COUNT(CASE WHEN l.status = 'converted' THEN 1 END) * 100.0 / NULLIF(COUNT(*), 0)),
+                2
+            ) as conversion_rate,
+            COUNT(*) as total_leads,
+            COUNT(CASE WHEN l.status = 'converted' THEN 1 END) as converted_leads
+        FROM leads l
+        JOIN lead_assignments la ON l.lead_id = la.lead_id
+        JOIN agents a ON la.agent_id = a.agent_id
+        GROUP BY l.source_type, la.agent_id, a.full_name
+    """),
+)
+
+
+def upgrade() -> None:
+    for name, key, body in VIEWS:
+        op.execute(f'CREATE MATERIALIZED VIEW {name} AS {body}')
+        op.execute(f'CREATE UNIQUE INDEX uq_{name} ON {name} ({", ".join(key)})')
+
+
+def downgrade() -> None:
+    for name, _, _ in reversed(VIEWS):
+        op.execute(f'DROP MATERIALIZED VIEW {name}')
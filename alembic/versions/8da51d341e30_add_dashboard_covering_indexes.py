@@ -0,0 +1,70 @@
+"""add dashboard covering indexes
+
+Revision ID: 8da51d341e30
+Revises: 924be657aed4
+Create Date: 2026-10-16 09:12:41.503218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8da51d341e30'
+down_revision = '924be657aed4'
+branch_labels = None
+depends_on = None
+
+
+DASHBOARD_INDEXES = (
+    ('ix_lead_assignments_agent_id', 'lead_assignments', ['agent_id'],
+     {'postgresql_include': ['lead_id', 'assigned_at']}),
+    ('ix_follow_up_tasks_agent_pending', 'follow_up_tasks', ['agent_id', 'due_date'],
+     {'postgresql_include': ['task_id', 'lead_id', 'type', 'priority'],
+      'postgresql_where': sa.text("status = 'pending'")}),
+    ('ix_conversion_history_agent_changed', 'lead_conversion_history', ['agent_id', 'changed_at'], {}),
+    ('ix_lead_activities_lead_id_at', 'lead_activities', ['lead_id', 'activity_at'], {}),
+)
+
+
+def upgrade() -> None:
+    # Agent dashboard lookups; INCLUDE columns let them run as index-only scans.
+    # Built CONCURRENTLY (outside the migration transaction) so writes to these
+    # tables are not blocked while the indexes build.
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in DASHBOARD_INDEXES:
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_concurrently=True, if_not_exists=True, **options,
+            )
+
+        if not op.get_context().as_sql:
+            # A failed concurrent build leaves an INVALID index behind instead of
+            # rolling back; fail loudly rather than keep a useless index around.
+            invalid = op.get_bind().execute(
+                sa.text(
+                    "SELECT c.relname FROM pg_index i "
+                    "JOIN pg_class c ON c.oid = i.indexrelid "
+                    "WHERE NOT i.indisvalid AND c.relname = ANY(:names)"
+                ),
+                {'names': [name for name, *_ in DASHBOARD_INDEXES]},
+            ).scalars().all()
+            if invalid:
+                raise RuntimeError(
+                    f"Concurrent index build left invalid indexes: {', '.join(invalid)}; "
+                    "drop them and re-run the migration"
+                )
+
+        # VACUUM sets the visibility map bits that index-only scans depend on.
+        op.execute('VACUUM (ANALYZE) lead_assignments, follow_up_tasks, lead_conversion_history, lead_activities')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in (
+            ('ix_lead_activities_lead_id_at', 'lead_activities'),
+            ('ix_conversion_history_agent_changed', 'lead_conversion_history'),
+            ('ix_follow_up_tasks_agent_pending', 'follow_up_tasks'),
+            ('ix_lead_assignments_agent_id', 'lead_assignments'),
+        ):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
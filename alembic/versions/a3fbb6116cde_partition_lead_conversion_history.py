@@ -0,0 +1,108 @@
+"""partition lead_conversion_history by month
+
+Revision ID: a3fbb6116cde
+Revises: 8da51d341e30
+Create Date: 2026-10-16 10:04:17.228951
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3fbb6116cde'
+down_revision = '8da51d341e30'
+branch_labels = None
+depends_on = None
+
+
+# Creates one monthly partition per month in [from_month, to_month]. Intended
+# to be re-run periodically (cron / pg_cron) to keep partitions ahead of now().
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_lead_conversion_history_partitions(from_month date, to_month date)
+RETURNS void AS $$
+DECLARE
+    m date := date_trunc('month', from_month)::date;
+BEGIN
+    WHILE m <= to_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF lead_conversion_history FOR VALUES FROM (%L) TO (%L)',
+            'lead_conversion_history_' || to_char(m, 'YYYY_MM'),
+            m,
+            (m + interval '1 month')::date
+        );
+        m := (m + interval '1 month')::date;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.execute("SET LOCAL maintenance_work_mem = '256MB'")
+
+    op.rename_table('lead_conversion_history', 'lead_conversion_history_old')
+    op.execute('ALTER TABLE lead_conversion_history_old RENAME CONSTRAINT lead_conversion_history_pkey TO lead_conversion_history_old_pkey')
+    op.drop_index('ix_conversion_history_agent_changed', table_name='lead_conversion_history_old')
+
+    op.create_table('lead_conversion_history',
+    sa.Column('history_id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('lead_id', sa.UUID(), nullable=False),
+    sa.Column('status_from', sa.String(length=50), nullable=True),
+    sa.Column('status_to', sa.String(length=50), nullable=True),
+    sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('agent_id', sa.UUID(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['agent_id'], ['agents.agent_id'], name='lead_conversion_history_agent_id_fkey'),
+    sa.ForeignKeyConstraint(['lead_id'], ['leads.lead_id'], ondelete='CASCADE', name='lead_conversion_history_lead_id_fkey'),
+    sa.PrimaryKeyConstraint('history_id', 'changed_at'),
+    postgresql_partition_by='RANGE (changed_at)',
+    )
+
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+    op.execute("""
+        SELECT create_lead_conversion_history_partitions(
+            (SELECT COALESCE(MIN(changed_at), now()) FROM lead_conversion_history_old)::date,
+            (now() + interval '12 months')::date
+        )
+    """)
+    # Catch-all so inserts never fail when the partition job falls behind.
+    op.execute('CREATE TABLE lead_conversion_history_default PARTITION OF lead_conversion_history DEFAULT')
+
+    op.execute("""
+        INSERT INTO lead_conversion_history (history_id, lead_id, status_from, status_to, changed_at, agent_id, notes)
+        SELECT history_id, lead_id, status_from, status_to, COALESCE(changed_at, now()), agent_id, notes
+        FROM lead_conversion_history_old
+    """)
+    op.drop_table('lead_conversion_history_old')
+
+    # Partitioned index: created on the parent and cascaded to every partition.
+    op.create_index('ix_conversion_history_agent_changed', 'lead_conversion_history', ['agent_id', 'changed_at'])
+    op.execute('ANALYZE lead_conversion_history')
+
+
+def downgrade() -> None:
+    op.rename_table('lead_conversion_history', 'lead_conversion_history_partitioned')
+    op.execute('ALTER TABLE lead_conversion_history_partitioned RENAME CONSTRAINT lead_conversion_history_pkey TO lead_conversion_history_partitioned_pkey')
+    op.drop_index('ix_conversion_history_agent_changed', table_name='lead_conversion_history_partitioned')
+
+    op.create_table('lead_conversion_history',
+    sa.Column('history_id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('lead_id', sa.UUID(), nullable=False),
+    sa.Column('status_from', sa.String(length=50), nullable=True),
+    sa.Column('status_to', sa.String(length=50), nullable=True),
+    sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('agent_id', sa.UUID(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['agent_id'], ['agents.agent_id'], name='lead_conversion_history_agent_id_fkey'),
+    sa.ForeignKeyConstraint(['lead_id'], ['leads.lead_id'], ondelete='CASCADE', name='lead_conversion_history_lead_id_fkey'),
+    sa.PrimaryKeyConstraint('history_id')
+    )
+    op.execute("""
+        INSERT INTO lead_conversion_history (history_id, lead_id, status_from, status_to, changed_at, agent_id, notes)
+        SELECT history_id, lead_id, status_from, status_to, changed_at, agent_id, notes
+        FROM lead_conversion_history_partitioned
+    """)
+    op.drop_table('lead_conversion_history_partitioned')
+    op.execute('DROP FUNCTION IF EXISTS create_lead_conversion_history_partitions(date, date)')
+    op.create_index('ix_conversion_history_agent_changed', 'lead_conversion_history', ['agent_id', 'changed_at'])
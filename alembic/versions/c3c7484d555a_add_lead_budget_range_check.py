@@ -0,0 +1,32 @@
+"""add lead budget range check
+
+Revision ID: c3c7484d555a
+Revises: e6f86dc15054
+Create Date: 2026-10-16 13:21:09.518402
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3c7484d555a'
+down_revision = 'e6f86dc15054'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Add the constraint NOT VALID (brief lock, no scan), then validate it in
+    # its own transaction under SHARE UPDATE EXCLUSIVE so lead writes keep
+    # flowing during the scan.
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.create_check_constraint(
+        'ck_budget_range', 'leads', 'budget_min < budget_max',
+        postgresql_not_valid=True,
+    )
+    with op.get_context().autocommit_block():
+        op.execute('ALTER TABLE leads VALIDATE CONSTRAINT ck_budget_range')
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_budget_range', 'leads', type_='check')
@@ -0,0 +1,119 @@
+"""partition lead_activities by month
+
+Revision ID: c8b9fcf4f56f
+Revises: 122ec2f6d85e
+Create Date: 2026-10-16 16:10:42.915637
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8b9fcf4f56f'
+down_revision = '122ec2f6d85e'
+branch_labels = None
+depends_on = None
+
+
+# Same scheme as lead_conversion_history: one partition per month in
+# [from_month, to_month], re-run periodically to stay ahead of now().
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_lead_activities_partitions(from_month date, to_month date)
+RETURNS void AS $$
+DECLARE
+    m date := date_trunc('month', from_month)::date;
+BEGIN
+    WHILE m <= to_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF lead_activities FOR VALUES FROM (%L) TO (%L)',
+            'lead_activities_' || to_char(m, 'YYYY_MM'),
+            m,
+            (m + interval '1 month')::date
+        );
+        m := (m + interval '1 month')::date;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def _create_indexes() -> None:
+    # Partitioned indexes: created on the parent and cascaded to every partition.
+    op.create_index('ix_lead_activities_lead_id_at', 'lead_activities', ['lead_id', 'activity_at'])
+    op.create_index(
+        'brin_lead_activities_activity_at', 'lead_activities', ['activity_at'],
+        postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+    )
+
+
+def _drop_indexes(table: str) -> None:
+    op.drop_index('brin_lead_activities_activity_at', table_name=table)
+    op.drop_index('ix_lead_activities_lead_id_at', table_name=table)
+
+
+def _create_table(partitioned: bool) -> None:
+    op.create_table('lead_activities',
+    sa.Column('activity_id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('lead_id', sa.UUID(), nullable=False),
+    sa.Column('agent_id', sa.UUID(), nullable=False),
+    sa.Column('type', sa.String(length=50), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('outcome', sa.String(length=20), nullable=True),
+    sa.Column('activity_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=not partitioned),
+    sa.CheckConstraint("outcome IN ('positive', 'negative', 'neutral') OR outcome IS NULL", name='ck_activity_outcome'),
+    sa.CheckConstraint("type IN ('call', 'email', 'whatsapp', 'viewing', 'meeting', 'offer_made')", name='ck_activity_type'),
+    sa.ForeignKeyConstraint(['agent_id'], ['agents.agent_id'], ondelete='CASCADE', name='lead_activities_agent_id_fkey'),
+    sa.ForeignKeyConstraint(['lead_id'], ['leads.lead_id'], ondelete='CASCADE', name='lead_activities_lead_id_fkey'),
+    sa.PrimaryKeyConstraint(*(('activity_id', 'activity_at') if partitioned else ('activity_id',))),
+    **({'postgresql_partition_by': 'RANGE (activity_at)'} if partitioned else {}),
+    )
+
+
+COLUMNS = 'activity_id, lead_id, agent_id, type, notes, outcome, activity_at'
+
+
+def upgrade() -> None:
+    op.execute("SET LOCAL maintenance_work_mem = '256MB'")
+
+    op.rename_table('lead_activities', 'lead_activities_old')
+    op.execute('ALTER TABLE lead_activities_old RENAME CONSTRAINT lead_activities_pkey TO lead_activities_old_pkey')
+    _drop_indexes('lead_activities_old')
+
+    _create_table(partitioned=True)
+
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+    op.execute("""
+        SELECT create_lead_activities_partitions(
+            (SELECT COALESCE(MIN(activity_at), now()) FROM lead_activities_old)::date,
+            (now() + interval '12 months')::date
+        )
+    """)
+    # Catch-all so inserts never fail when the partition job falls behind.
+    op.execute('CREATE TABLE lead_activities_default PARTITION OF lead_activities DEFAULT')
+
+    op.execute(f"""
+        INSERT INTO lead_activities ({COLUMNS})
+        SELECT activity_id, lead_id, agent_id, type, notes, outcome, COALESCE(activity_at, now())
+        FROM lead_activities_old
+    """)
+    op.drop_table('lead_activities_old')
+
+    _create_indexes()
+    op.execute('ANALYZE lead_activities')
+
+
+def downgrade() -> None:
+    op.rename_table('lead_activities', 'lead_activities_partitioned')
+    op.execute('ALTER TABLE lead_activities_partitioned RENAME CONSTRAINT lead_activities_pkey TO lead_activities_partitioned_pkey')
+    _drop_indexes('lead_activities_partitioned')
+
+    _create_table(partitioned=False)
+    op.execute(f"""
+        INSERT INTO lead_activities ({COLUMNS})
+        SELECT {COLUMNS}
+        FROM lead_activities_partitioned
+    """)
+    op.drop_table('lead_activities_partitioned')
+    op.execute('DROP FUNCTION IF EXISTS create_lead_activities_partitions(date, date)')
+    _create_indexes()
@@ -0,0 +1,43 @@
+"""track report view refreshes
+
+Revision ID: cad407815d6b
+Revises: 7679a439a892
+Create Date: 2026-10-16 18:02:37.412905
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'cad407815d6b'
+down_revision = '7679a439a892'
+branch_labels = None
+depends_on = None
+
+
+# Snapshot of app.services.analytics.REPORT_VIEWS at the time of this revision
+REPORT_VIEWS = (
+    'mv_monthly_lead_trends',
+    'mv_source_quality_monthly',
+    'mv_revenue_by_source',
+    'mv_conversion_rates_src_agent',
+)
+
+
+def upgrade() -> None:
+    op.create_table('report_view_refreshes',
+    sa.Column('view_name', sa.String(length=63), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('view_name')
+    )
+    # The views were populated when 8bacb6902c29 created them, so start the
+    # clock now rather than have every worker refresh on its first cycle
+    op.execute(
+        "INSERT INTO report_view_refreshes (view_name, refreshed_at) VALUES "
+        + ", ".join(f"('{name}', now())" for name in REPORT_VIEWS)
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('report_view_refreshes')
@@ -0,0 +1,44 @@
+"""cover agent_id in lead assignment unique
+
+Revision ID: e4bee8d5be4e
+Revises: e3bbf1cdc2c8
+Create Date: 2026-10-16 14:10:27.830514
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4bee8d5be4e'
+down_revision = 'e3bbf1cdc2c8'
+branch_labels = None
+depends_on = None
+
+
+def _swap_unique_index(include_agent_id: bool) -> None:
+    # Build the replacement index CONCURRENTLY, then re-point the constraint at
+    # it in one short ALTER (the index takes over the constraint's name).
+    include = ' INCLUDE (agent_id)' if include_agent_id else ''
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_lead_assignment_new '
+            f'ON lead_assignments (lead_id){include}'
+        )
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute(
+        'ALTER TABLE lead_assignments '
+        'DROP CONSTRAINT uq_lead_assignment, '
+        'ADD CONSTRAINT uq_lead_assignment UNIQUE USING INDEX uq_lead_assignment_new'
+    )
+
+
+def upgrade() -> None:
+    # The listeners resolve a lead's agent with
+    # SELECT agent_id FROM lead_assignments WHERE lead_id = :lid on every status
+    # change; carrying agent_id in the unique index makes that index-only.
+    # agent_id only changes on reassignment, so HOT is rarely affected.
+    _swap_unique_index(include_agent_id=True)
+
+
+def downgrade() -> None:
+    _swap_unique_index(include_agent_id=False)
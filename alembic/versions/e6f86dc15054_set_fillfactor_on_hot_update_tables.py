@@ -0,0 +1,37 @@
+"""set fillfactor on hot update tables
+
+Revision ID: e6f86dc15054
+Revises: 093468f8a6c1
+Create Date: 2026-10-16 11:58:20.731604
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6f86dc15054'
+down_revision = '093468f8a6c1'
+branch_labels = None
+depends_on = None
+
+
+FILLFACTORS = (
+    ('leads', 85),
+    ('follow_up_tasks', 85),
+    ('lead_assignments', 90),
+)
+
+
+def upgrade() -> None:
+    # Leave free space on each page so status/score/due_date updates can stay
+    # HOT (same-page, no new index entries). Only pages written from now on
+    # honour the setting; rewrite existing ones off-peak with pg_repack.
+    for table, fillfactor in FILLFACTORS:
+        op.execute(f'ALTER TABLE {table} SET (fillfactor = {fillfactor})')
+
+    op.execute('ANALYZE leads, follow_up_tasks, lead_assignments')
+
+
+def downgrade() -> None:
+    for table, _ in FILLFACTORS:
+        op.execute(f'ALTER TABLE {table} RESET (fillfactor)')
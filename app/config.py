@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -6,7 +7,16 @@ class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 25
+    ANALYTICS_DB_POOL_SIZE: int = 10
+    ANALYTICS_DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    ANALYTICS_REFRESH_INTERVAL: int = 3600  # seconds between report view refreshes; 0 disables
     DEBUG: bool = False
+    SQLALCHEMY_ECHO: bool = False  # statement logging, independent of DEBUG
+    TESTING: bool = False
     LOG_LEVEL: str = "INFO"
     
     class Config:
@@ -14,4 +24,10 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse the environment/.env once per process and reuse the result."""
+    return Settings()
+
+
+settings = get_settings()
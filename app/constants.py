@@ -0,0 +1,42 @@
+"""Lead status vocabulary and transition rules shared by the API and the ORM listeners."""
+
+from types import MappingProxyType
+
+LEAD_STATUSES = ("new", "contacted", "qualified", "viewing_scheduled", "negotiation", "converted", "lost")
+
+TERMINAL_STATUSES = frozenset({"converted", "lost"})
+
+# Per-agent cap, mirrored by the ck_active_leads_max CHECK on agents
+MAX_ACTIVE_LEADS = 50
+
+ALLOWED_TRANSITIONS = MappingProxyType({
+    "new": frozenset({"contacted", "lost"}),
+    "contacted": frozenset({"qualified", "lost"}),
+    "qualified": frozenset({"viewing_scheduled", "lost"}),
+    "viewing_scheduled": frozenset({"negotiation", "qualified", "lost"}),
+    "negotiation": frozenset({"converted", "lost"}),
+    "converted": frozenset(),  # Terminal state
+    "lost": frozenset(),  # Terminal state
+})
+
+# Bitmask form: each status gets a bit, each source status an int mask of its
+# allowed targets, so a transition check is one shift + AND.
+STATUS_BIT = {status: bit for bit, status in enumerate(LEAD_STATUSES)}
+ALLOWED_MASK = [
+    sum(1 << STATUS_BIT[target] for target in ALLOWED_TRANSITIONS[status])
+    for status in LEAD_STATUSES
+]
+TERMINAL_MASK = sum(1 << STATUS_BIT[status] for status in TERMINAL_STATUSES)
+
+
+def can_transition(current_status: str, new_status: str) -> bool:
+    current_bit = STATUS_BIT.get(current_status)
+    new_bit = STATUS_BIT.get(new_status)
+    if current_bit is None or new_bit is None:
+        return False
+    return bool(ALLOWED_MASK[current_bit] >> new_bit & 1)
+
+
+def is_terminal(status: str) -> bool:
+    bit = STATUS_BIT.get(status)
+    return bit is not None and bool(TERMINAL_MASK >> bit & 1)
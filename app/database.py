@@ -2,13 +2,58 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.pool import NullPool
 from app.config import settings
 
-# Async engine with asyncpg driver
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
-    poolclass=NullPool,  # For simplicity; use QueuePool in production with proper pool settings
-)
+# Async engines with the asyncpg driver. Pooled (AsyncAdaptedQueuePool, the
+# async default) so bursts reuse warm connections and their prepared
+# statements instead of reconnecting per request; LIFO checkout keeps the
+# hottest connections in use and lets idle ones age out. Tests get NullPool so
+# each event loop opens its own connections.
+def _pool_options(pool_size: int, max_overflow: int) -> dict:
+    if settings.TESTING:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_use_lifo": True,
+    }
+
+
+def _create_engine(application_name: str, pool_size: int, max_overflow: int):
+    return create_async_engine(
+        settings.DATABASE_URL,
+        # Per-statement logging stringifies every parameter set; opt in explicitly
+        # rather than inheriting it from DEBUG
+        echo=settings.SQLALCHEMY_ECHO,
+        future=True,
+        # Room for every distinct ORM/Core statement shape the app emits, so none
+        # are evicted and recompiled under load
+        query_cache_size=1200,
+        connect_args={
+            # Short OLTP/report queries never pay back JIT compile time. Server-side
+            # keepalives surface dead idle connections without a pre-ping on every
+            # checkout (/health/db is the explicit ping).
+            "server_settings": {
+                "jit": "off",
+                "application_name": application_name,
+                "tcp_keepalives_idle": "30",
+            },
+            "command_timeout": 60,
+            "statement_cache_size": 1024,
+            "prepared_statement_cache_size": 512,
+        },
+        **_pool_options(pool_size, max_overflow),
+    )
+
+
+engine = _create_engine("thinkrealty", settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+
+# Analytics reports get their own pool, so a burst of dashboard aggregates
+# waits on its own connections instead of starving lead capture and updates.
+# Every transaction on it is READ ONLY.
+analytics_engine = _create_engine(
+    "thinkrealty-analytics", settings.ANALYTICS_DB_POOL_SIZE, settings.ANALYTICS_DB_MAX_OVERFLOW,
+).execution_options(postgresql_readonly=True)
 
 # Async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -18,8 +63,37 @@ AsyncSessionLocal = async_sessionmaker(
     future=True,
 )
 
+# Same pool, but every transaction opens as BEGIN READ ONLY (asyncpg folds the
+# mode into the BEGIN itself, so no extra round trip); the flag is reset when
+# the connection goes back to the pool.
+read_only_engine = engine.execution_options(postgresql_readonly=True)
+
+ReadOnlySessionLocal = async_sessionmaker(
+    read_only_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    future=True,
+)
+
+AnalyticsSessionLocal = async_sessionmaker(
+    analytics_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    future=True,
+)
+
 
 async def get_db():
-    """Dependency for FastAPI routes to get async session."""
+    """Dependency for FastAPI routes to get async session.
+
+    The session autobegins on its first statement, so everything a request
+    runs before it commits shares a single transaction.
+    """
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_read_db():
+    """Session for read-only endpoints: one READ ONLY transaction per request."""
+    async with ReadOnlySessionLocal() as session:
+        yield session
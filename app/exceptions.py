@@ -1,45 +1,62 @@
 """Custom exceptions for ThinkRealty application."""
 
+import logging
+
 from fastapi import HTTPException
 
 
-class DuplicateLeadError(HTTPException):
+class ThinkRealtyError(HTTPException):
+    """Base for application errors; main.py renders them all with one handler.
+
+    Subclasses set error_type (the "type" field of the JSON body) and the
+    log_level their occurrences are logged at.
+    """
+
+    error_type = "error"
+    log_level = logging.WARNING
+
+
+class DuplicateLeadError(ThinkRealtyError):
     """Raised when a duplicate lead is detected."""
 
+    error_type = "duplicate_lead"
+
     def __init__(self, detail: str = "Duplicate lead detected"):
         super().__init__(status_code=400, detail=detail)
 
 
-class AgentOverloadError(HTTPException):
+class AgentOverloadError(ThinkRealtyError):
     """Raised when an agent has reached maximum capacity."""
 
+    error_type = "agent_overload"
+    log_level = logging.ERROR
+
     def __init__(self, detail: str = "Agent overload - no capacity"):
         super().__init__(status_code=503, detail=detail)
 
 
-class InvalidLeadDataError(HTTPException):
+class InvalidLeadDataError(ThinkRealtyError):
     """Raised when lead data is invalid."""
 
+    error_type = "invalid_lead_data"
+
     def __init__(self, detail: str = "Invalid lead data"):
         super().__init__(status_code=422, detail=detail)
 
 
-class FollowUpConflictError(HTTPException):
+class FollowUpConflictError(ThinkRealtyError):
     """Raised when there are conflicting follow-up schedules."""
 
+    error_type = "follow_up_conflict"
+
     def __init__(self, detail: str = "Conflicting follow-up schedule"):
         super().__init__(status_code=409, detail=detail)
 
 
-class InvalidStatusTransitionError(HTTPException):
+class InvalidStatusTransitionError(ThinkRealtyError):
     """Raised when an invalid status transition is attempted."""
 
-    def __init__(self, detail: str = "Invalid status transition"):
-        super().__init__(status_code=400, detail=detail)
+    error_type = "invalid_status_transition"
 
-
-class PropertyServiceUnavailableError(HTTPException):
-    """Raised when property suggestion service is unavailable."""
-
-    def __init__(self, detail: str = "Property service unavailable"):
-        super().__init__(status_code=503, detail=detail)
\ No newline at end of file
+    def __init__(self, detail: str = "Invalid status transition"):
+        super().__init__(status_code=400, detail=detail)
\ No newline at end of file
@@ -1,103 +1,111 @@
 """FastAPI application entry point (Day 1: minimal setup)."""
 
-from fastapi import FastAPI, Request
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import FastAPI, Request, Depends
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 import logging
+import orjson
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.database import analytics_engine, engine, get_db
+from app.services.analytics import REPORT_VIEWS_POLL_INTERVAL, LeadAnalytics
 from app.routers.leads import router as leads_router
 from app.routers.agents import router as agents_router
-from app.exceptions import (
-    DuplicateLeadError,
-    AgentOverloadError,
-    InvalidLeadDataError,
-    FollowUpConflictError,
-    InvalidStatusTransitionError,
-    PropertyServiceUnavailableError
-)
+from app.exceptions import ThinkRealtyError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+if not settings.SQLALCHEMY_ECHO:
+    # Keep SQLAlchemy's statement/cache lines out of the INFO root logger
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+
+async def refresh_report_views_periodically(interval: int) -> None:
+    # Every worker runs this loop, but the refresh times are kept in the
+    # database, so the views are rebuilt once per interval across all of them
+    while True:
+        await asyncio.sleep(min(interval, REPORT_VIEWS_POLL_INTERVAL))
+        try:
+            await LeadAnalytics.refresh_report_views(interval)
+        except Exception:
+            logger.exception("Refreshing analytics report views failed")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    refresh_task = None
+    if settings.ANALYTICS_REFRESH_INTERVAL > 0 and not settings.TESTING:
+        refresh_task = asyncio.create_task(
+            refresh_report_views_periodically(settings.ANALYTICS_REFRESH_INTERVAL)
+        )
+    try:
+        yield
+    finally:
+        if refresh_task is not None:
+            refresh_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await refresh_task
+        # Close the pooled connections instead of leaving them to the server
+        await engine.dispose()
+        await analytics_engine.dispose()
+
 
 app = FastAPI(
     title="ThinkRealty Lead Management System",
     description="Professional lead management for UAE real estate with AI-powered scoring",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.include_router(leads_router)
 app.include_router(agents_router)
 
 
-@app.exception_handler(DuplicateLeadError)
-async def duplicate_lead_handler(request: Request, exc: DuplicateLeadError):
-    logger.warning(f"Duplicate lead detected: {exc.detail}")
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={"detail": exc.detail, "type": "duplicate_lead"}
-    )
-
-
-@app.exception_handler(AgentOverloadError)
-async def agent_overload_handler(request: Request, exc: AgentOverloadError):
-    logger.error(f"Agent overload: {exc.detail}")
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={"detail": exc.detail, "type": "agent_overload"}
-    )
-
-
-@app.exception_handler(InvalidLeadDataError)
-async def invalid_lead_data_handler(request: Request, exc: InvalidLeadDataError):
-    logger.warning(f"Invalid lead data: {exc.detail}")
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={"detail": exc.detail, "type": "invalid_lead_data"}
-    )
+_VALIDATION_ERROR_TYPE = "validation_error"
 
 
-@app.exception_handler(FollowUpConflictError)
-async def follow_up_conflict_handler(request: Request, exc: FollowUpConflictError):
-    logger.warning(f"Follow-up conflict: {exc.detail}")
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={"detail": exc.detail, "type": "follow_up_conflict"}
+def _error_response(status_code: int, body: dict) -> Response:
+    # Error bodies are small fixed-shape dicts; orjson encodes them in C
+    # instead of the stdlib encoder behind JSONResponse. default=str covers
+    # the exception objects pydantic can leave in validation error contexts.
+    return Response(
+        content=orjson.dumps(body, default=str),
+        status_code=status_code,
+        media_type="application/json",
     )
 
 
-@app.exception_handler(InvalidStatusTransitionError)
-async def invalid_status_transition_handler(request: Request, exc: InvalidStatusTransitionError):
-    logger.warning(f"Invalid status transition: {exc.detail}")
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={"detail": exc.detail, "type": "invalid_status_transition"}
-    )
-
-
-@app.exception_handler(PropertyServiceUnavailableError)
-async def property_service_unavailable_handler(request: Request, exc: PropertyServiceUnavailableError):
-    logger.error(f"Property service unavailable: {exc.detail}")
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={"detail": exc.detail, "type": "property_service_unavailable"}
-    )
+@app.exception_handler(ThinkRealtyError)
+async def think_realty_error_handler(request: Request, exc: ThinkRealtyError):
+    # One handler for every application error; the class carries its type and log level
+    logger.log(exc.log_level, f"{exc.error_type}: {exc.detail}")
+    return _error_response(exc.status_code, {"detail": exc.detail, "type": exc.error_type})
 
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     logger.warning(f"Request validation error: {exc.errors()}")
-    return JSONResponse(
-        status_code=422,
-        content={
-            "detail": "Request validation failed",
-            "errors": exc.errors(),
-            "type": "validation_error"
-        }
-    )
+    return _error_response(422, {
+        "detail": "Request validation failed",
+        "errors": exc.errors(),
+        "type": _VALIDATION_ERROR_TYPE
+    })
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
     return {"status": "ok"}
+
+
+@app.get("/health/db")
+async def db_health_check(db: AsyncSession = Depends(get_db)):
+    """Database liveness; the pool does not pre-ping, so this is the one explicit ping."""
+    await db.execute(text("SELECT 1"))
+    return {"status": "ok"}
@@ -9,6 +9,8 @@ from app.models.property_interest import LeadPropertyInterest
 from app.models.lead_source import LeadSource
 from app.models.performance_metric import AgentPerformanceMetric
 from app.models.conversion_history import LeadConversionHistory
+from app.models.status_transition import LeadStatusTransition
+from app.models.report_view_refresh import ReportViewRefresh
 
 # Import event listeners to register them
 from app.models import listeners  # noqa: F401
@@ -25,4 +27,6 @@ __all__ = [
     "LeadSource",
     "AgentPerformanceMetric",
     "LeadConversionHistory",
+    "LeadStatusTransition",
+    "ReportViewRefresh",
 ]
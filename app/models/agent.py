@@ -1,12 +1,12 @@
-from sqlalchemy import Column, String, Integer, DateTime, CheckConstraint, ARRAY
+from sqlalchemy import Column, String, Integer, DateTime, CheckConstraint, ARRAY, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.base import Base
+from app.models.base import Base, uuid7
 from sqlalchemy.sql import func
 
 class Agent(Base):
     __tablename__ = "agents"
-    agent_id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    agent_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     full_name = Column(String(200), nullable=False)
     email = Column(String(255), unique=True, nullable=False)
     phone = Column(String(20), unique=True, nullable=False)
@@ -15,12 +15,17 @@ class Agent(Base):
     language_skills = Column(ARRAY(String))
     active_leads_count = Column(Integer, nullable=False, server_default="0")
 
-    assignments = relationship("LeadAssignment", back_populates="agent", cascade="all, delete-orphan")
-    activities = relationship("LeadActivity", back_populates="agent", cascade="all, delete-orphan")
-    tasks = relationship("FollowUpTask", back_populates="agent", cascade="all, delete-orphan")
-    performance_metrics = relationship("AgentPerformanceMetric", back_populates="agent", cascade="all, delete-orphan")
+    # Children are removed by the FKs' ON DELETE CASCADE; deleting the parent
+    # is a single DELETE, with no child loads or per-row ORM deletes
+    assignments = relationship("LeadAssignment", back_populates="agent", cascade="save-update, merge", passive_deletes="all")
+    activities = relationship("LeadActivity", back_populates="agent", cascade="save-update, merge", passive_deletes="all")
+    tasks = relationship("FollowUpTask", back_populates="agent", cascade="save-update, merge", passive_deletes="all")
+    performance_metrics = relationship("AgentPerformanceMetric", back_populates="agent", cascade="save-update, merge", passive_deletes="all")
 
     __table_args__ = (
         CheckConstraint("active_leads_count <= 50", name="ck_active_leads_max"),
         CheckConstraint("active_leads_count >= 0", name="ck_active_leads_nonneg"),
+        Index("ix_agents_spec_property_type_gin", "specialization_property_type", postgresql_using="gin"),
+        Index("ix_agents_spec_areas_gin", "specialization_areas", postgresql_using="gin"),
+        Index("ix_agents_language_skills_gin", "language_skills", postgresql_using="gin"),
     )
\ No newline at end of file
@@ -1,13 +1,13 @@
 
-from sqlalchemy import Column, DateTime, Text, UniqueConstraint, ForeignKey
+from sqlalchemy import Column, DateTime, Text, UniqueConstraint, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.base import Base
+from app.models.base import Base, uuid7
 from sqlalchemy.sql import func
 
 class LeadAssignment(Base):
     __tablename__ = "lead_assignments"
-    assignment_id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    assignment_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.lead_id", ondelete="CASCADE"), nullable=False)
     agent_id = Column(UUID(as_uuid=True), ForeignKey("agents.agent_id", ondelete="CASCADE"), nullable=False)
     assigned_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -18,5 +18,8 @@ class LeadAssignment(Base):
     agent = relationship("Agent", back_populates="assignments")
 
     __table_args__ = (
-        UniqueConstraint("lead_id", name="uq_lead_assignment"),
+        # agent_id rides along so the listeners' lead -> agent lookup is index-only
+        UniqueConstraint("lead_id", name="uq_lead_assignment", postgresql_include=["agent_id"]),
+        Index("ix_lead_assignments_agent_id", "agent_id", postgresql_include=["lead_id", "assigned_at"]),
+        {"postgresql_with": {"fillfactor": 90}},
     )
\ No newline at end of file
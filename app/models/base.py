@@ -1,3 +1,20 @@
+import os
+import time
+import uuid
+
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
+
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7): 48-bit Unix ms timestamp + random bits.
+
+    Used as the client-side primary key default so inserts need no RETURNING
+    round trip for the key, and new keys land at the right edge of the B-tree
+    instead of on random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
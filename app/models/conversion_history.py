@@ -1,17 +1,36 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Text, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.base import Base
+from app.models.base import Base, uuid7
+from app.models.enums import LEAD_STATUS
+from app.models.types import Money
 from sqlalchemy.sql import func
+from sqlalchemy import text
 
 class LeadConversionHistory(Base):
     __tablename__ = "lead_conversion_history"
-    history_id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    history_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.lead_id", ondelete="CASCADE"), nullable=False)
-    status_from = Column(String(50))
-    status_to = Column(String(50))
-    changed_at = Column(DateTime(timezone=True), server_default=func.now())
-    agent_id = Column(UUID(as_uuid=True), ForeignKey("agents.agent_id"))
+    status_from = Column(LEAD_STATUS)
+    status_to = Column(LEAD_STATUS)
+    # Part of the primary key because the table is range-partitioned by month on it
+    changed_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
+    agent_id = Column(UUID(as_uuid=True), ForeignKey("agents.agent_id", ondelete="SET NULL"))
+    deal_value = Column("deal_value_fils", Money)
     notes = Column(Text)
 
-    lead = relationship("Lead", back_populates="conversion_history")
\ No newline at end of file
+    lead = relationship("Lead", back_populates="conversion_history")
+
+    __table_args__ = (
+        Index("ix_conversion_history_lead_status", "lead_id", "status_to", "changed_at"),
+        Index("ix_conversion_history_agent_changed", "agent_id", "changed_at"),
+        Index(
+            "ix_conversion_history_converted", "lead_id", "changed_at",
+            postgresql_where=text("status_to = 'converted'"),
+        ),
+        Index(
+            "brin_conversion_history_changed_at", "changed_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "RANGE (changed_at)"},
+    )
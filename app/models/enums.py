@@ -0,0 +1,7 @@
+from sqlalchemy.dialects.postgresql import ENUM
+
+from app.constants import LEAD_STATUSES
+
+# Native enum: 4 bytes per row instead of a varchar plus a CHECK. The type is
+# created and dropped by migrations, not by table DDL.
+LEAD_STATUS = ENUM(*LEAD_STATUSES, name="lead_status", create_type=False)
@@ -1,13 +1,15 @@
-from sqlalchemy import Column, String, Numeric, Integer, DateTime, CheckConstraint, UniqueConstraint, ARRAY, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, DateTime, CheckConstraint, UniqueConstraint, ARRAY, ForeignKey, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.base import Base
+from app.models.base import Base, uuid7
+from app.models.enums import LEAD_STATUS
+from app.models.types import Money
 from sqlalchemy.sql import func
 from sqlalchemy import text
 
 class Lead(Base):
     __tablename__ = "leads"
-    lead_id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    lead_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     source_type = Column(String(50), nullable=False)
     first_name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False)
@@ -15,24 +17,28 @@ class Lead(Base):
     phone = Column(String(20), nullable=False)
     nationality = Column(String(50))
     language_preference = Column(String(20))
-    budget_min = Column(Numeric(15, 2))
-    budget_max = Column(Numeric(15, 2))
+    budget_min = Column("budget_min_fils", Money)
+    budget_max = Column("budget_max_fils", Money)
     property_type = Column(String(50))
     preferred_areas = Column(ARRAY(String))
-    status = Column(String(50), nullable=False, server_default="new")
+    status = Column(LEAD_STATUS, nullable=False, server_default="new")
     score = Column(Integer, nullable=False, server_default=text("0"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    assignments = relationship("LeadAssignment", back_populates="lead", cascade="all, delete-orphan")
-    activities = relationship("LeadActivity", back_populates="lead", cascade="all, delete-orphan")
-    property_interests = relationship("LeadPropertyInterest", back_populates="lead", cascade="all, delete-orphan")
-    conversion_history = relationship("LeadConversionHistory", back_populates="lead", cascade="all, delete-orphan")
-    sources = relationship("LeadSource", back_populates="lead", cascade="all, delete-orphan")
+    # Children are removed by the FKs' ON DELETE CASCADE; deleting the parent
+    # is a single DELETE, with no child loads or per-row ORM deletes
+    assignments = relationship("LeadAssignment", back_populates="lead", cascade="save-update, merge", passive_deletes="all")
+    activities = relationship("LeadActivity", back_populates="lead", cascade="save-update, merge", passive_deletes="all")
+    property_interests = relationship("LeadPropertyInterest", back_populates="lead", cascade="save-update, merge", passive_deletes="all")
+    conversion_history = relationship("LeadConversionHistory", back_populates="lead", cascade="save-update, merge", passive_deletes="all")
+    sources = relationship("LeadSource", back_populates="lead", cascade="save-update, merge", passive_deletes="all")
 
     __table_args__ = (
         UniqueConstraint("phone", "source_type", name="uq_phone_source"),
         CheckConstraint("score BETWEEN 0 AND 100", name="ck_score_range"),
-        CheckConstraint("status IN ('new', 'contacted', 'qualified', 'viewing_scheduled', 'negotiation', 'converted', 'lost')", name="ck_lead_status"),
+        CheckConstraint("budget_min_fils < budget_max_fils", name="ck_budget_range"),
         CheckConstraint("source_type IN ('bayut', 'propertyFinder', 'dubizzle', 'website', 'walk_in', 'referral')", name="ck_source_type"),
+        Index("ix_leads_preferred_areas_gin", "preferred_areas", postgresql_using="gin"),
+        {"postgresql_with": {"fillfactor": 85}},
     )
\ No newline at end of file
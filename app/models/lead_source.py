@@ -1,13 +1,13 @@
 from sqlalchemy import Column, String, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.base import Base
+from app.models.base import Base, uuid7
 from sqlalchemy.sql import func
 from sqlalchemy import CheckConstraint,DateTime
 
 class LeadSource(Base):
     __tablename__ = "lead_sources"
-    source_id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    source_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.lead_id", ondelete="CASCADE"), nullable=False)
     source_type = Column(String(50), nullable=False)
     campaign_id = Column(String(100))
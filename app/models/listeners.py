@@ -1,87 +1,157 @@
 from datetime import datetime, timedelta, timezone
-from sqlalchemy import event, text, inspect
-from sqlalchemy.orm import Session
+from sqlalchemy import event, text, inspect, bindparam, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session, object_session
 
+from app.constants import is_terminal
+from app.models.enums import LEAD_STATUS
 from app.models.lead import Lead
-from app.models.agent import Agent
 from app.models.assignment import LeadAssignment
 from app.models.task import FollowUpTask
-from app.models.conversion_history import LeadConversionHistory
 
 
-# Auto updated_at
+# Auto updated_at (agents has no updated_at column, so it is not registered).
+# before_update also fires for objects that are dirty without any net column
+# change; skip those so they don't turn into a timestamp-only UPDATE.
 @event.listens_for(Lead, "before_update")
-@event.listens_for(Agent, "before_update")
-@event.listens_for(FollowUpTask, "before_update")
 def update_timestamp(mapper, connection, target):
-    target.updated_at = datetime.now(timezone.utc)
+    if object_session(target).is_modified(target, include_collections=False):
+        target.updated_at = datetime.now(timezone.utc)
+
+
+# Active leads count maintenance: apply a +/-1 delta for the single row that
+# changed instead of recounting every assignment the agent holds.
+#
+# The listener statements are built once at import with typed bind params, so
+# every flush reuses the same objects and hits the engine's compiled cache.
+_ADJUST_IF_LEAD_OPEN = text("""
+    UPDATE agents
+    SET active_leads_count = active_leads_count + :delta
+    WHERE agent_id = :aid
+    AND EXISTS (
+        SELECT 1 FROM leads
+        WHERE lead_id = :lid
+        AND status NOT IN ('converted', 'lost')
+    )
+""").bindparams(
+    bindparam("delta", type_=Integer),
+    bindparam("aid", type_=UUID(as_uuid=True)),
+    bindparam("lid", type_=UUID(as_uuid=True)),
+)
+
+_ADJUST_ASSIGNED_AGENT = text("""
+    UPDATE agents
+    SET active_leads_count = active_leads_count + :delta
+    WHERE agent_id = (
+        SELECT agent_id FROM lead_assignments WHERE lead_id = :lid
+    )
+""").bindparams(
+    bindparam("delta", type_=Integer),
+    bindparam("lid", type_=UUID(as_uuid=True)),
+)
+
+_LOG_STATUS_CHANGE = text("""
+    INSERT INTO lead_conversion_history (lead_id, status_from, status_to, agent_id)
+    SELECT :lid, :old, :new,
+           (SELECT agent_id FROM lead_assignments WHERE lead_id = :lid)
+""").bindparams(
+    bindparam("lid", type_=UUID(as_uuid=True)),
+    bindparam("old", type_=LEAD_STATUS),
+    bindparam("new", type_=LEAD_STATUS),
+)
 
 
-# Active leads count refresh
 @event.listens_for(LeadAssignment, "after_insert")
+def increment_active_leads_count(mapper, connection, target):
+    connection.execute(_ADJUST_IF_LEAD_OPEN, {"delta": 1, "aid": target.agent_id, "lid": target.lead_id})
+
+
 @event.listens_for(LeadAssignment, "after_delete")
+def decrement_active_leads_count(mapper, connection, target):
+    connection.execute(_ADJUST_IF_LEAD_OPEN, {"delta": -1, "aid": target.agent_id, "lid": target.lead_id})
+
+
+# Deleting a lead cascades its assignment inside Postgres, where the
+# LeadAssignment listener never sees it; release the agent's slot up front.
+_RELEASE_DELETED_LEAD = text("""
+    UPDATE agents
+    SET active_leads_count = active_leads_count - 1
+    FROM lead_assignments la
+    JOIN leads l ON l.lead_id = la.lead_id
+    WHERE la.lead_id = :lid
+    AND agents.agent_id = la.agent_id
+    AND l.status NOT IN ('converted', 'lost')
+""").bindparams(bindparam("lid", type_=UUID(as_uuid=True)))
+
+
+@event.listens_for(Lead, "before_delete")
+def release_deleted_lead(mapper, connection, target):
+    connection.execute(_RELEASE_DELETED_LEAD, {"lid": target.lead_id})
+
+
 @event.listens_for(Lead, "after_update")
 def refresh_active_leads_count(mapper, connection, target):
-    agent_id = getattr(target, "agent_id", None)
-    if not agent_id and hasattr(target, "lead_id"):
-        agent_id = connection.scalar(
-            text("SELECT agent_id FROM lead_assignments WHERE lead_id = :lid"),
-            {"lid": target.lead_id}
-        )
-    if agent_id:
-        connection.execute(text("""
-            UPDATE agents
-            SET active_leads_count = (
-                SELECT COUNT(*)
-                FROM lead_assignments la
-                JOIN leads l ON la.lead_id = l.lead_id
-                WHERE la.agent_id = :aid
-                AND l.status NOT IN ('converted', 'lost')
-            )
-            WHERE agent_id = :aid
-        """), {"aid": agent_id})
-
-
-# Status transition validation + history log
-ALLOWED_TRANSITIONS = {
-    "new": {"contacted"},
-    "contacted": {"qualified"},
-    "qualified": {"viewing_scheduled"},
-    "viewing_scheduled": {"negotiation"},
-    "negotiation": {"converted", "lost"},
-    "converted": set(),
-    "lost": set(),
-}
-
-@event.listens_for(Session, "before_flush")
-def validate_status_and_log(session: Session, flush_context, instances):
-    for obj in session.dirty:
-        if isinstance(obj, Lead):
-            state = inspect(obj)
-            if state.attrs.status.history.has_changes():
-                old = state.attrs.status.history.deleted[0] if state.attrs.status.history.deleted else None
-                new = state.attrs.status.history.added[0]
-                if old and new and new not in ALLOWED_TRANSITIONS.get(old, set()):
-                    raise ValueError(f"Invalid transition: {old} → {new}")
-
-                agent_id = session.execute(
-                    text("SELECT agent_id FROM lead_assignments WHERE lead_id = :lid"),
-                    {"lid": obj.lead_id}
-                ).scalar()
-
-                session.add(
-                    LeadConversionHistory(
-                        lead_id=obj.lead_id,
-                        status_from=old,
-                        status_to=new,
-                        agent_id=agent_id
-                    )
-                )
+    history = inspect(target).attrs.status.history
+    if not history.added or not history.deleted:
+        return
+    was_active = not is_terminal(history.deleted[0])
+    is_active = not is_terminal(history.added[0])
+    if was_active == is_active:
+        return
+    connection.execute(_ADJUST_ASSIGNED_AGENT, {"delta": 1 if is_active else -1, "lid": target.lead_id})
+
+
+# Status history log. The transition rules themselves are enforced by the
+# trg_leads_status_transition trigger on leads. Assignments to Lead.status are
+# stashed on the session as they happen, so flushes never scan session.dirty;
+# the whole transaction's history rows are written in one batched statement.
+STATUS_CHANGES_KEY = "_status_changes"
+
+
+@event.listens_for(Lead.status, "set")
+def record_status_change(target, value, oldvalue, initiator):
+    session = object_session(target)
+    # New leads are inserted with their initial status; only updates are logged
+    if session is None or target.lead_id is None or target in session.new or value == oldvalue:
+        return
+    old = oldvalue if isinstance(oldvalue, str) else None
+    session.info.setdefault(STATUS_CHANGES_KEY, []).append({"lid": target.lead_id, "old": old, "new": value})
+
+
+@event.listens_for(Session, "before_commit")
+def log_status_changes(session: Session):
+    changes = session.info.pop(STATUS_CHANGES_KEY, None)
+    if changes:
+        # before_commit runs ahead of commit's own final flush; flush now so
+        # the agent lookup sees pending assignment and lead changes
+        session.flush()
+        # Resolve the assigned agent and write the history rows in one
+        # statement, straight on the connection: no ORM execution path and
+        # no autoflush re-entering the flush listeners
+        session.connection().execute(_LOG_STATUS_CHANGE, changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_status_changes(session: Session):
+    session.info.pop(STATUS_CHANGES_KEY, None)
 
 
 # Block long-overdue follow-ups
+OVERDUE_LIMIT = timedelta(days=30)
+
+
 @event.listens_for(FollowUpTask, "before_insert")
-@event.listens_for(FollowUpTask, "before_update")
 def block_overdue_task(mapper, connection, target):
-    if target.due_date < datetime.now(timezone.utc) - timedelta(days=30):
+    if target.due_date < datetime.now(timezone.utc) - OVERDUE_LIMIT:
+        raise ValueError("Follow-up overdue >30 days not allowed")
+
+
+# Tasks get a single before_update hook doing both the overdue check and the
+# updated_at bump, so each task UPDATE pays one listener dispatch instead of two.
+@event.listens_for(FollowUpTask, "before_update")
+def task_before_update(mapper, connection, target):
+    now = datetime.now(timezone.utc)
+    if target.due_date < now - OVERDUE_LIMIT:
         raise ValueError("Follow-up overdue >30 days not allowed")
+    if object_session(target).is_modified(target, include_collections=False):
+        target.updated_at = now
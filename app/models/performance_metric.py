@@ -1,15 +1,16 @@
 from sqlalchemy import Column, Numeric, Interval, Integer, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.base import Base
+from app.models.base import Base, uuid7
+from app.models.types import Money
 from sqlalchemy.sql import func
 
 class AgentPerformanceMetric(Base):
     __tablename__ = "agent_performance_metrics"
-    metric_id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    metric_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     agent_id = Column(UUID(as_uuid=True), ForeignKey("agents.agent_id", ondelete="CASCADE"), nullable=False)
     conversion_rate = Column(Numeric(5, 2))
-    average_deal_size = Column(Numeric(15, 2))
+    average_deal_size = Column("average_deal_size_fils", Money)
     average_response_time = Column(Interval)
     leads_handled = Column(Integer)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
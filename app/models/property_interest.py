@@ -1,12 +1,12 @@
 from sqlalchemy import Column, String, DateTime, CheckConstraint, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.base import Base
+from app.models.base import Base, uuid7
 from sqlalchemy.sql import func
 
 class LeadPropertyInterest(Base):
     __tablename__ = "lead_property_interests"
-    interest_id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    interest_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.lead_id", ondelete="CASCADE"), nullable=False)
     property_id = Column(UUID(as_uuid=True), nullable=False)
     interest_level = Column(String(20), nullable=False)
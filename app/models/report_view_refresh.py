@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, DateTime
+from app.models.base import Base
+
+class ReportViewRefresh(Base):
+    """When each analytics materialized view was last refreshed.
+
+    Shared by every worker, so LeadAnalytics.refresh_report_views rebuilds a
+    view at most once per ANALYTICS_REFRESH_INTERVAL however many run the loop.
+    """
+    __tablename__ = "report_view_refreshes"
+    view_name = Column(String(63), primary_key=True)
+    refreshed_at = Column(DateTime(timezone=True), nullable=False)
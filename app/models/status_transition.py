@@ -0,0 +1,9 @@
+from sqlalchemy import Column
+from app.models.base import Base
+from app.models.enums import LEAD_STATUS
+
+class LeadStatusTransition(Base):
+    """Allowed lead status moves, read by the check_lead_transition trigger on leads."""
+    __tablename__ = "lead_status_transitions"
+    from_status = Column(LEAD_STATUS, primary_key=True)
+    to_status = Column(LEAD_STATUS, primary_key=True)
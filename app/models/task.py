@@ -1,12 +1,12 @@
-from sqlalchemy import Column, String, DateTime, CheckConstraint, ForeignKey
+from sqlalchemy import Column, String, DateTime, CheckConstraint, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.base import Base
+from app.models.base import Base, uuid7
 from sqlalchemy.sql import func
 
 class FollowUpTask(Base):
     __tablename__ = "follow_up_tasks"
-    task_id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    task_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.lead_id", ondelete="CASCADE"), nullable=False)
     agent_id = Column(UUID(as_uuid=True), ForeignKey("agents.agent_id", ondelete="CASCADE"), nullable=False)
     type = Column(String(50), nullable=False)
@@ -23,4 +23,10 @@ class FollowUpTask(Base):
         CheckConstraint("type IN ('call', 'email', 'whatsapp', 'viewing')", name="ck_task_type"),
         CheckConstraint("priority IN ('high', 'medium', 'low')", name="ck_task_priority"),
         CheckConstraint("status IN ('pending', 'completed', 'overdue')", name="ck_task_status"),
+        Index(
+            "ix_follow_up_tasks_agent_pending", "agent_id", "due_date",
+            postgresql_include=["task_id", "lead_id", "type", "priority"],
+            postgresql_where=text("status = 'pending'"),
+        ),
+        {"postgresql_with": {"fillfactor": 85}},
     )
\ No newline at end of file
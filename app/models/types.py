@@ -0,0 +1,27 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import BigInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class Money(TypeDecorator):
+    """AED amount stored as BIGINT fils (1/100 AED).
+
+    Python sees Decimal with two places, so ORM code and schemas keep working
+    in AED, while Postgres compares and aggregates plain int8 values instead
+    of NUMERIC. Raw SQL reads the *_fils columns and divides by 100 itself.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int((Decimal(str(value)) * 100).to_integral_value(ROUND_HALF_UP))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # AVG() over the column comes back as NUMERIC; scale it the same way
+        return Decimal(value).scaleb(-2)
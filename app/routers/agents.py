@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_, case, text
-from datetime import datetime, timedelta
+from datetime import timedelta
 from uuid import UUID
 from typing import Optional
 
-from app.database import get_db
+from app.database import get_read_db
 from app.schemas.agent_dashboard import (
     AgentDashboardResponse,
     DateRange,
@@ -19,7 +19,13 @@ from app.models.task import FollowUpTask
 from app.models.activity import LeadActivity
 from app.models.conversion_history import LeadConversionHistory
 
-router = APIRouter(prefix="/api/v1/agents")
+router = APIRouter(prefix="/api/v1/agents", tags=["Agents"])
+
+DATE_RANGE_WINDOWS = {
+    DateRange.seven_days: timedelta(days=7),
+    DateRange.thirty_days: timedelta(days=30),
+    DateRange.ninety_days: timedelta(days=90),
+}
 
 
 @router.get("/{agent_id}/dashboard", response_model=AgentDashboardResponse)
@@ -28,30 +34,23 @@ async def get_agent_dashboard(
     date_range: Optional[DateRange] = Query(None),
     status_filter: Optional[StatusFilter] = Query(None),
     source_filter: Optional[SourceFilter] = Query(None),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ) -> AgentDashboardResponse:
     # Check if agent exists
-    agent_query = select(Agent).where(Agent.agent_id == agent_id)
-    agent_result = await db.execute(agent_query)
-    agent = agent_result.scalar_one_or_none()
-    if not agent:
+    agent_query = select(Agent.agent_id).where(Agent.agent_id == agent_id)
+    if await db.scalar(agent_query) is None:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    # Calculate date filter
-    now = datetime.utcnow()
+    # Calculate date filter. Cutoffs are computed by Postgres from now() so the
+    # windows follow the database clock and no datetimes are built per request.
     date_filter = None
-    if date_range:
-        if date_range == DateRange.seven_days:
-            date_filter = now - timedelta(days=7)
-        elif date_range == DateRange.thirty_days:
-            date_filter = now - timedelta(days=30)
-        elif date_range == DateRange.ninety_days:
-            date_filter = now - timedelta(days=90)
+    if date_range in DATE_RANGE_WINDOWS:
         # custom is handled by default (no filter)
+        date_filter = func.now() - DATE_RANGE_WINDOWS[date_range]
 
     # Build base filters
     filters = [LeadAssignment.agent_id == agent_id]
-    if date_filter:
+    if date_filter is not None:
         filters.append(Lead.created_at >= date_filter)
     if status_filter and status_filter != StatusFilter.all:
         if status_filter == StatusFilter.active:
@@ -73,13 +72,13 @@ async def get_agent_dashboard(
 
     # Overdue follow-ups
     overdue_query = select(func.count(FollowUpTask.task_id)).where(
-        and_(FollowUpTask.agent_id == agent_id, FollowUpTask.due_date < now, FollowUpTask.status == "pending")
+        and_(FollowUpTask.agent_id == agent_id, FollowUpTask.due_date < func.now(), FollowUpTask.status == "pending")
     )
     overdue_result = await db.execute(overdue_query)
     overdue_follow_ups = overdue_result.scalar()
 
     # This month conversions
-    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    month_start = func.date_trunc("month", func.now())
     conversions_query = select(func.count(LeadConversionHistory.history_id)).where(
         and_(LeadConversionHistory.agent_id == agent_id, LeadConversionHistory.changed_at >= month_start)
     )
@@ -184,7 +183,7 @@ async def get_agent_dashboard(
     conversion_rate = (converted_leads / total_leads) * 100 if total_leads > 0 else 0
 
     # Average deal size (simplified - using budget_max as deal size for converted leads)
-    deal_size_query = select(func.avg(Lead.budget_max)).select_from(
+    deal_size_query = select(func.avg(Lead.budget_max, type_=Lead.budget_max.type)).select_from(
         Lead
     ).join(LeadAssignment, Lead.lead_id == LeadAssignment.lead_id).where(and_(LeadAssignment.agent_id == agent_id, Lead.status == "converted"))
     deal_size_result = await db.execute(deal_size_query)
@@ -1,14 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func
+from sqlalchemy import select, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only, raiseload
 from datetime import datetime, timedelta, timezone
-from uuid import uuid4, UUID
-from typing import Optional
+from uuid import UUID
 
 from app.database import get_db
+from app.schemas.common import ErrorResponse
 from app.schemas.lead import LeadCaptureRequest, LeadCaptureResponse, LeadUpdate, LeadUpdateResponse
 from app.services.lead_scoring import LeadScoringEngine
 from app.services.lead_assignment import LeadAssignmentManager
+from app.models.base import uuid7
 from app.models.lead import Lead
 from app.models.agent import Agent
 from app.models.assignment import LeadAssignment
@@ -16,10 +20,22 @@ from app.models.lead_source import LeadSource
 from app.models.task import FollowUpTask
 from app.models.activity import LeadActivity
 from app.models.property_interest import LeadPropertyInterest
+from app.constants import MAX_ACTIVE_LEADS
 from app.dependencies import LeadValidator
-from app.exceptions import AgentOverloadError
+from app.exceptions import AgentOverloadError, DuplicateLeadError, InvalidStatusTransitionError
 
-router = APIRouter(prefix="/api/v1/leads")
+# Error shapes every lead endpoint can return, declared once for the whole router
+LEAD_ERROR_RESPONSES = {
+    400: {"model": ErrorResponse},
+    409: {"model": ErrorResponse},
+    503: {"model": ErrorResponse},
+}
+
+router = APIRouter(prefix="/api/v1/leads", tags=["Leads"], responses=LEAD_ERROR_RESPONSES)
+
+# Stateless services, built once per process rather than per request
+scoring_engine = LeadScoringEngine()
+assignment_manager = LeadAssignmentManager()
 
 
 @router.post("/capture", response_model=LeadCaptureResponse)
@@ -27,56 +43,54 @@ async def capture_lead(
     request: LeadCaptureRequest,
     db: AsyncSession = Depends(get_db)
 ) -> LeadCaptureResponse:
-    # Validate lead data
-    await LeadValidator.validate_lead_data(request.lead_data.dict())
-
-    # Check for duplicate lead (same phone + source_type within 24h)
-    await LeadValidator.check_duplicate_lead(request.lead_data.phone, request.source_type, db)
-
-    # Check property service availability
-    await LeadValidator.check_property_service()
-
     # Calculate lead score
-    scoring_engine = LeadScoringEngine()
     lead_score = await scoring_engine.calculate_lead_score(request.lead_data.dict(), request.source_details.dict(), db)
 
+    # Create lead record. uq_phone_source makes the insert itself the duplicate
+    # check: a conflicting phone + source_type returns no row instead of a
+    # separate SELECT round trip racing the INSERT.
+    lead_id = await db.scalar(
+        pg_insert(Lead)
+        .values(
+            lead_id=uuid7(),
+            source_type=request.source_type,
+            first_name=request.lead_data.first_name,
+            last_name=request.lead_data.last_name,
+            email=request.lead_data.email,
+            phone=request.lead_data.phone,
+            nationality=request.lead_data.nationality,
+            language_preference=request.lead_data.language_preference,
+            budget_min=request.lead_data.budget_min,
+            budget_max=request.lead_data.budget_max,
+            property_type=request.lead_data.property_type,
+            preferred_areas=request.lead_data.preferred_areas,
+            status="new",
+            score=lead_score
+        )
+        .on_conflict_do_nothing(index_elements=["phone", "source_type"])
+        .returning(Lead.lead_id)
+    )
+    if lead_id is None:
+        raise DuplicateLeadError()
+
     # Assign agent
-    assignment_manager = LeadAssignmentManager()
     agent_id = await assignment_manager.assign_lead(request.lead_data.dict(), db)
     if not agent_id:
+        # Undo the lead row inserted above instead of leaving it to session close
+        await db.rollback()
         raise AgentOverloadError()
 
-    # Validate agent capacity
-    await LeadValidator.validate_agent_capacity(agent_id, db)
-
-    # Create lead record
-    lead_id = uuid4()
-    lead = Lead(
-        lead_id=lead_id,
-        source_type=request.source_type,
-        first_name=request.lead_data.first_name,
-        last_name=request.lead_data.last_name,
-        email=request.lead_data.email,
-        phone=request.lead_data.phone,
-        nationality=request.lead_data.nationality,
-        language_preference=request.lead_data.language_preference,
-        budget_min=request.lead_data.budget_min,
-        budget_max=request.lead_data.budget_max,
-        property_type=request.lead_data.property_type,
-        preferred_areas=request.lead_data.preferred_areas,
-        status="new",
-        score=lead_score
-    )
-    db.add(lead)
+    # Reserve the agent's slot: capacity check and count bump in one statement
+    if await assignment_manager.try_reserve_slot(agent_id, MAX_ACTIVE_LEADS, db) is None:
+        await db.rollback()
+        raise AgentOverloadError()
 
     # Validate referrer_agent_id if provided
     referrer_agent_id = None
     if request.source_details.referrer_agent_id:
-        # Check if the agent exists
-        agent_query = select(Agent).where(Agent.agent_id == request.source_details.referrer_agent_id)
-        agent_result = await db.execute(agent_query)
-        agent = agent_result.scalar_one_or_none()
-        if agent:
+        # Check if the agent exists; only the key is needed, not an Agent entity
+        agent_query = select(Agent.agent_id).where(Agent.agent_id == request.source_details.referrer_agent_id)
+        if await db.scalar(agent_query) is not None:
             referrer_agent_id = request.source_details.referrer_agent_id
 
     # Create lead_sources record
@@ -101,21 +115,18 @@ async def capture_lead(
     )
     db.add(follow_up_task)
 
-    # Create LeadAssignment record and update agent count
-    lead_assignment = LeadAssignment(
-        lead_id=lead_id,
-        agent_id=agent_id,
-        reason="Initial assignment"
+    # Create LeadAssignment record. Core insert, so the ORM after_insert
+    # listener doesn't count the slot already reserved above a second time.
+    await db.execute(
+        insert(LeadAssignment).values(
+            lead_id=lead_id,
+            agent_id=agent_id,
+            reason="Initial assignment"
+        )
     )
-    db.add(lead_assignment)
-    
-    # Update agent active leads count
-    await db.execute(update(Agent).where(Agent.agent_id == agent_id).values(active_leads_count=Agent.active_leads_count + 1))
 
-    # Get assigned agent details
-    agent_query = select(Agent).where(Agent.agent_id == agent_id)
-    agent_result = await db.execute(agent_query)
-    agent = agent_result.scalar_one()
+    # Get assigned agent details (already in the identity map from agent selection)
+    agent = await db.get(Agent, agent_id, options=[raiseload("*")])
 
     await db.commit()
 
@@ -137,8 +148,8 @@ async def update_lead(
     update_data: LeadUpdate,
     db: AsyncSession = Depends(get_db)
 ) -> LeadUpdateResponse:
-    # Get the lead
-    lead_query = select(Lead).where(Lead.lead_id == lead_id)
+    # Get the lead; only its status is read here, the listeners track the rest
+    lead_query = select(Lead).options(load_only(Lead.lead_id, Lead.status), raiseload("*")).where(Lead.lead_id == lead_id)
     result = await db.execute(lead_query)
     lead = result.scalar_one_or_none()
     if not lead:
@@ -147,7 +158,17 @@ async def update_lead(
     # Validate status transition if status is being updated
     if update_data.status:
         await LeadValidator.validate_status_transition(lead.status, update_data.status)
+        old_status = lead.status
         lead.status = update_data.status.value
+        # trg_leads_status_transition re-checks the move against the status
+        # row Postgres actually holds, catching a concurrent change
+        try:
+            await db.flush()
+        except IntegrityError as exc:
+            await db.rollback()
+            if "Invalid transition" in str(exc.orig):
+                raise InvalidStatusTransitionError(f"Cannot transition from {old_status} to {update_data.status.value}")
+            raise
 
     # If activity provided, create LeadActivity
     if update_data.activity:
@@ -168,19 +189,17 @@ async def update_lead(
         db.add(activity)
 
         # Update lead score
-        scoring_engine = LeadScoringEngine()
         await scoring_engine.update_lead_score(lead_id, {"type": update_data.activity.type.value, "outcome": update_data.activity.outcome.value}, db)
 
         # If next_follow_up, check for conflicts and update or create FollowUpTask
         if update_data.activity.next_follow_up:
-            from datetime import datetime
             next_follow_up_dt = datetime.fromisoformat(update_data.activity.next_follow_up.replace('Z', '+00:00'))
 
             # Check for follow-up conflicts
             await LeadValidator.check_follow_up_conflicts(agent_id, next_follow_up_dt, db=db)
 
             # Check if there's an existing pending task
-            task_query = select(FollowUpTask).where(
+            task_query = select(FollowUpTask).options(raiseload("*")).where(
                 FollowUpTask.lead_id == lead_id,
                 FollowUpTask.status == "pending"
             )
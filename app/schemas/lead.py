@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr, model_validator
 from typing import List, Optional
 from enum import Enum
 from uuid import UUID
@@ -69,6 +69,13 @@ class LeadCreate(BaseModel):
     property_type: PropertyType
     preferred_areas: List[str] = Field(..., min_items=1)
 
+    @model_validator(mode="after")
+    def validate_budget_range(self) -> "LeadCreate":
+        # Mirrors ck_budget_range on leads, so bad input is a 422 before any DB work
+        if self.budget_min >= self.budget_max:
+            raise ValueError("budget_min must be less than budget_max")
+        return self
+
 
 class SourceDetailsCreate(BaseModel):
     campaign_id: Optional[str] = None
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy import select, text
 
 from app.config import settings
+from app.services.lead_ingest import bulk_copy_leads, copy_rows
 from app.models import (
     Base,
     Lead,
@@ -36,15 +37,14 @@ async def seed():
     async with session_maker() as session:
         print("Seeding Day 1 sample data (PDF compliant)")
 
-        # Clear existing data to allow re-running the seed
-        await session.execute(text("DELETE FROM lead_conversion_history"))
-        await session.execute(text("DELETE FROM lead_property_interests"))
-        await session.execute(text("DELETE FROM follow_up_tasks"))
-        await session.execute(text("DELETE FROM lead_activities"))
-        await session.execute(text("DELETE FROM lead_assignments"))
-        await session.execute(text("DELETE FROM lead_sources"))
-        await session.execute(text("DELETE FROM leads"))
-        await session.execute(text("DELETE FROM agents"))
+        # Clear existing data to allow re-running the seed (one statement
+        # instead of a DELETE round-trip per table)
+        await session.execute(text("""
+            TRUNCATE lead_conversion_history, lead_property_interests,
+                     follow_up_tasks, lead_activities, lead_assignments,
+                     lead_sources, leads, agents
+            CASCADE
+        """))
         await session.commit()
         print("Cleared existing data")
 
@@ -93,8 +93,10 @@ async def seed():
             ["Business Bay", "Dubai Hills Estate"],
         ]
 
+        # Leads, activities, interests, history and sources have no insert-time
+        # ORM listeners, so each is loaded with a single COPY.
         for i in range(120):
-            lead = Lead(
+            leads.append(dict(
                 source_type=SOURCE_TYPES[i % len(SOURCE_TYPES)],
                 first_name=["Ahmed", "Fatima", "Mohammed", "Layla", "Hassan"][i % 5],
                 last_name=["Al Mansoori", "Khan", "Al Naqbi", "Patel", "Smith"][i % 5],
@@ -108,10 +110,8 @@ async def seed():
                 preferred_areas=areas_lists[i % len(areas_lists)],
                 status=STATUS_VALUES[i % len(STATUS_VALUES)],
                 score=30 + (i % 71),
-            )
-            session.add(lead)
-            leads.append(lead)
-        await session.flush()
+            ))
+        await bulk_copy_leads(leads, session)
         print(f"Created {len(leads)} leads")
 
         # 4. Assign EVERY lead (mandatory rule)
@@ -119,7 +119,7 @@ async def seed():
         for i, lead in enumerate(leads):
             agent = agents[i % len(agents)]
             ass = LeadAssignment(
-                lead_id=lead.lead_id,
+                lead_id=lead["lead_id"],
                 agent_id=agent.agent_id,
                 assigned_at=datetime.now(timezone.utc) - timedelta(days=90 - (i % 90)),
             )
@@ -129,21 +129,18 @@ async def seed():
         print(f"Created {len(assignments)} assignments (all leads assigned)")
 
         # 5. Lead activities ≥50
-        activities = []
-        for i in range(70):
-            lead = leads[i % len(leads)]
-            agent = agents[i % len(agents)]
-            act = LeadActivity(
-                lead_id=lead.lead_id,
-                agent_id=agent.agent_id,
-                type=ACTIVITY_TYPES[i % len(ACTIVITY_TYPES)],
-                notes=f"Activity {i+1}",
-                outcome=OUTCOMES[i % len(OUTCOMES)],
-                activity_at=datetime.now(timezone.utc) - timedelta(days=45 - (i % 45)),
-            )
-            session.add(act)
-            activities.append(act)
-        await session.flush()
+        activities = [
+            {
+                "lead_id": leads[i % len(leads)]["lead_id"],
+                "agent_id": agents[i % len(agents)].agent_id,
+                "type": ACTIVITY_TYPES[i % len(ACTIVITY_TYPES)],
+                "notes": f"Activity {i+1}",
+                "outcome": OUTCOMES[i % len(OUTCOMES)],
+                "activity_at": datetime.now(timezone.utc) - timedelta(days=45 - (i % 45)),
+            }
+            for i in range(70)
+        ]
+        await copy_rows(LeadActivity, activities, session)
         print(f"Created {len(activities)} activities")
 
         # 6. Follow-up tasks ≥50 (combined with activities meets "50+ activities and follow-ups")
@@ -152,7 +149,7 @@ async def seed():
             lead = leads[i % len(leads)]
             agent = agents[i % len(agents)]
             task = FollowUpTask(
-                lead_id=lead.lead_id,
+                lead_id=lead["lead_id"],
                 agent_id=agent.agent_id,
                 type=TASK_TYPES[i % len(TASK_TYPES)],
                 due_date=datetime.now(timezone.utc) + timedelta(days=(i % 20) - 10),
@@ -164,45 +161,45 @@ async def seed():
         print(f"Created {len(tasks)} follow-up tasks")
 
         # 7. Property interests ≥20
-        interests = []
-        for i in range(30):
-            lead = leads[i % len(leads)]
-            interest = LeadPropertyInterest(
-                lead_id=lead.lead_id,
-                property_id=uuid4(),
-                interest_level=["high", "medium", "low"][i % 3],
-            )
-            session.add(interest)
-            interests.append(interest)
-        await session.flush()
+        interests = [
+            {
+                "lead_id": leads[i % len(leads)]["lead_id"],
+                "property_id": uuid4(),
+                "interest_level": ["high", "medium", "low"][i % 3],
+            }
+            for i in range(30)
+        ]
+        await copy_rows(LeadPropertyInterest, interests, session)
         print(f"Created {len(interests)} property interests")
 
         # 8. Conversion history — various outcomes
-        history = []
-        for i in range(40):
-            lead = leads[i % len(leads)]
-            hist = LeadConversionHistory(
-                lead_id=lead.lead_id,
-                status_from="new",
-                status_to=lead.status,
-                changed_at=datetime.now(timezone.utc) - timedelta(days=60 - (i % 60)),
-                agent_id=agents[i % len(agents)].agent_id,
-            )
-            session.add(hist)
-            history.append(hist)
-        await session.flush()
+        history = [
+            {
+                "lead_id": leads[i % len(leads)]["lead_id"],
+                "status_from": "new",
+                "status_to": leads[i % len(leads)]["status"],
+                "changed_at": datetime.now(timezone.utc) - timedelta(days=60 - (i % 60)),
+                "agent_id": agents[i % len(agents)].agent_id,
+            }
+            for i in range(40)
+        ]
+        await copy_rows(LeadConversionHistory, history, session)
         print(f"Created {len(history)} conversion history records")
 
         # 9. Attach per-lead sources
-        for i, lead in enumerate(leads):
-            src = LeadSource(
-                lead_id=lead.lead_id,
-                source_type=lead.source_type,
-                campaign_id=f"camp_{lead.source_type}_{i%5}",
-                utm_source=f"utm_{lead.source_type}",
-            )
-            session.add(src)
-        await session.flush()
+        await copy_rows(
+            LeadSource,
+            [
+                {
+                    "lead_id": lead["lead_id"],
+                    "source_type": lead["source_type"],
+                    "campaign_id": f"camp_{lead['source_type']}_{i%5}",
+                    "utm_source": f"utm_{lead['source_type']}",
+                }
+                for i, lead in enumerate(leads)
+            ],
+            session,
+        )
         print("Attached per-lead sources")
 
         await session.commit()
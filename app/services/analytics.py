@@ -1,37 +1,194 @@
-from typing import List, Dict, Any
+import asyncio
+import functools
+import time
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text, func, case
-from app.database import AsyncSessionLocal
+from sqlalchemy import text, func, case, select, update
+from app.database import AnalyticsSessionLocal, AsyncSessionLocal
+from app.models.report_view_refresh import ReportViewRefresh
+
+# Slow-moving aggregates precomputed as materialized views and refreshed on a
+# timer (see refresh_report_views); their reports read the views directly.
+REPORT_VIEWS = (
+    "mv_monthly_lead_trends",
+    "mv_source_quality_monthly",
+    "mv_revenue_by_source",
+    "mv_conversion_rates_src_agent",
+)
+# Advisory lock so only one worker at a time checks and refreshes the views
+REPORT_VIEWS_LOCK_ID = 7_305_114
+# How often each worker checks report_view_refreshes for views that are due
+REPORT_VIEWS_POLL_INTERVAL = 60
+
+
+class _ReportCache:
+    """Per-process TTL cache of report pages.
+
+    Dashboards poll the same pages on a timer, so repeats within TTL seconds
+    are answered without touching Postgres. Concurrent misses on one key share
+    a single query. invalidate() drops everything and bumps the generation, so
+    a query that started before it is not stored afterwards; it runs after the
+    report views refresh. New leads are not invalidated individually and show
+    up once an entry expires.
+
+    This is the only cache in front of the reports, and it is not shared
+    between workers. A page is therefore at most TTL seconds behind its query:
+    live reports lag the tables by up to TTL, and view-backed reports lag by up
+    to ANALYTICS_REFRESH_INTERVAL plus TTL (plus one poll interval), since only
+    the refreshing worker invalidates at once. Pass no_cache=True to
+    _paginate for a fresh read.
+    """
+
+    __slots__ = ("_entries", "_locks", "generation")
+
+    TTL = 30
+    MAXSIZE = 512
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self.generation = 0
+
+    def _get(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return entry[1]
+
+    async def get_or_load(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        value = self._get(key)
+        if value is not None:
+            return value
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                value = self._get(key)
+                if value is not None:
+                    return value
+                generation = self.generation
+                value = await load()
+                if generation == self.generation:
+                    if key not in self._entries and len(self._entries) >= self.MAXSIZE:
+                        # Evict the oldest insertion; dicts keep insertion order
+                        self._entries.pop(next(iter(self._entries)))
+                    self._entries[key] = (time.monotonic() + self.TTL, value)
+        finally:
+            # Also when load() raises, so failed keys don't pile up locks
+            self._locks.pop(key, None)
+        return value
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+
+_report_cache = _ReportCache()
+
+
+@functools.lru_cache(maxsize=64)
+def _paged_statement(sql: str):
+    """Paging statement for a report, built once per report.
+
+    LIMIT/OFFSET go directly after the report's own ORDER BY; a wrapping
+    SELECT would be free to drop that ordering and let pages overlap.
+    Reusing the same text() object keeps the SQL string byte-identical across
+    calls, so SQLAlchemy's compiled cache and asyncpg's per-connection
+    prepared-statement cache both hit instead of re-preparing each page.
+    """
+    return text(f"{sql.rstrip()}\nLIMIT :limit OFFSET :skip")
+
+
+@functools.lru_cache(maxsize=64)
+def _count_statement(sql: str):
+    """Row count of a whole report, built once per report like _paged_statement."""
+    return text(f"SELECT COUNT(*) FROM ({sql}) AS report")
 
 
 class LeadAnalytics:
     @staticmethod
-    async def get_lead_conversion_rates_by_source_and_agent() -> List[Dict[str, Any]]:
-        """Lead conversion rates by source and agent - dynamically calculated"""
+    async def refresh_report_views(max_age: int) -> bool:
+        """Refresh the report views last refreshed over max_age seconds ago.
+
+        Every worker calls this on a timer. The refresh times live in
+        report_view_refreshes, so whichever worker finds views due first
+        rebuilds them and the rest skip until they are due again. False if
+        nothing was due or another worker holds the lock.
+        """
+        async with AsyncSessionLocal() as session:
+            if not await session.scalar(select(func.pg_try_advisory_xact_lock(REPORT_VIEWS_LOCK_ID))):
+                return False
+            # Claim the due views and stamp them in one statement
+            due = (await session.scalars(
+                update(ReportViewRefresh)
+                .where(
+                    ReportViewRefresh.view_name.in_(REPORT_VIEWS),
+                    ReportViewRefresh.refreshed_at <= func.now() - timedelta(seconds=max_age)
+                )
+                .values(refreshed_at=func.now())
+                .returning(ReportViewRefresh.view_name)
+            )).all()
+            for view in due:
+                # CONCURRENTLY keeps the views readable while they rebuild
+                await session.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+            await session.commit()
+        if not due:
+            return False
+        _report_cache.invalidate()
+        return True
+
+    @staticmethod
+    async def _paginate(
+        query, skip: int, limit: int, include_total: bool = False, no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """Run a report query for one page of rows.
+
+        One extra row is fetched to tell whether another page follows. The
+        unpaged total needs a second query that aggregates the whole report,
+        so it is only computed when include_total is set.
+        Pages are served from the per-process report cache unless no_cache.
+        """
+        async def load() -> Dict[str, Any]:
+            return await LeadAnalytics._fetch_page(query, skip, limit, include_total)
+
+        if no_cache:
+            return await load()
+        return await _report_cache.get_or_load((query.text, skip, limit, include_total), load)
+
+    @staticmethod
+    async def _fetch_page(query, skip: int, limit: int, include_total: bool) -> Dict[str, Any]:
+        total = None
+        async with AnalyticsSessionLocal() as session:
+            result = await session.execute(_paged_statement(query.text), {"skip": skip, "limit": limit + 1})
+            rows = [dict(row) for row in result.mappings()]
+            if include_total:
+                total = await session.scalar(_count_statement(query.text))
+        has_more = len(rows) > limit
+        del rows[limit:]
+        return {
+            "items": rows,
+            "total": total,
+            "skip": skip,
+            "limit": limit,
+            "has_more": has_more,
+            "next_skip": skip + limit if has_more else None,
+        }
+
+    @staticmethod
+    async def get_lead_conversion_rates_by_source_and_agent(skip: int = 0, limit: int = 100, include_total: bool = False) -> Dict[str, Any]:
+        """Lead conversion rates by source and agent - from mv_conversion_rates_src_agent"""
         query = text("""
-            SELECT
-                l.source_type,
-                la.agent_id,
-                a.full_name as agent_name,
-                ROUND(
-                    (COUNT(CASE WHEN l.status = 'converted' THEN 1 END) * 100.0 / NULLIF(COUNT(*), 0)),
-                    2
-                ) as conversion_rate,
-                COUNT(*) as total_leads,
-                COUNT(CASE WHEN l.status = 'converted' THEN 1 END) as converted_leads
-            FROM leads l
-            JOIN lead_assignments la ON l.lead_id = la.lead_id
-            JOIN agents a ON la.agent_id = a.agent_id
-            GROUP BY l.source_type, la.agent_id, a.full_name
-            ORDER BY l.source_type, conversion_rate DESC
+            SELECT * FROM mv_conversion_rates_src_agent
+            ORDER BY source_type, conversion_rate DESC, agent_id
         """)
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(query)
-            return [dict(row) for row in result.mappings()]
+        return await LeadAnalytics._paginate(query, skip, limit, include_total)
 
     @staticmethod
-    async def get_average_time_to_conversion_by_property_type() -> List[Dict[str, Any]]:
+    async def get_average_time_to_conversion_by_property_type(skip: int = 0, limit: int = 100, include_total: bool = False) -> Dict[str, Any]:
         """Average time to conversion by property type - only for actual conversions"""
         query = text("""
             SELECT
@@ -44,35 +201,26 @@ class LeadAnalytics:
             AND l.property_type IS NOT NULL
             GROUP BY l.property_type
             HAVING COUNT(*) > 0
-            ORDER BY avg_days_to_conversion
+            ORDER BY avg_days_to_conversion, l.property_type
         """)
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(query)
-            return [dict(row) for row in result.mappings()]
+        return await LeadAnalytics._paginate(query, skip, limit, include_total)
 
     @staticmethod
-    async def get_monthly_lead_volume_trends() -> List[Dict[str, Any]]:
-        """Monthly lead volume trends"""
+    async def get_monthly_lead_volume_trends(skip: int = 0, limit: int = 100, include_total: bool = False) -> Dict[str, Any]:
+        """Monthly lead volume trends - from mv_monthly_lead_trends"""
         query = text("""
-            SELECT
-                DATE_TRUNC('month', created_at) as month,
-                COUNT(*) as lead_volume,
-                COUNT(CASE WHEN status = 'converted' THEN 1 END) as converted_volume
-            FROM leads
-            GROUP BY DATE_TRUNC('month', created_at)
+            SELECT * FROM mv_monthly_lead_trends
             ORDER BY month DESC
         """)
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(query)
-            return [dict(row) for row in result.mappings()]
+        return await LeadAnalytics._paginate(query, skip, limit, include_total)
 
     @staticmethod
-    async def get_agent_performance_rankings() -> List[Dict[str, Any]]:
+    async def get_agent_performance_rankings(skip: int = 0, limit: int = 100, include_total: bool = False) -> Dict[str, Any]:
         """Agent performance rankings - dynamically calculated from actual data"""
         query = text("""
-            WITH agent_stats AS (
+            WITH agent_stats AS NOT MATERIALIZED (
                 SELECT
                     a.agent_id,
                     a.full_name,
@@ -82,19 +230,19 @@ class LeadAnalytics:
                         (COUNT(CASE WHEN l.status = 'converted' THEN 1 END) * 100.0 / NULLIF(COUNT(la.lead_id), 0)),
                         2
                     ) as conversion_rate,
-                    COALESCE(AVG(lch.deal_value), 0) as average_deal_size,
+                    COALESCE(AVG(lch.deal_value_fils) / 100.0, 0) as average_deal_size,
                     AVG(EXTRACT(EPOCH FROM (la2.activity_at - l.created_at))/3600) as avg_response_hours
                 FROM agents a
                 LEFT JOIN lead_assignments la ON a.agent_id = la.agent_id
                 LEFT JOIN leads l ON la.lead_id = l.lead_id
                 LEFT JOIN lead_conversion_history lch ON l.lead_id = lch.lead_id AND lch.status_to = 'converted'
-                LEFT JOIN LATERAL (
-                    SELECT activity_at
-                    FROM lead_activities la_inner
-                    WHERE la_inner.lead_id = l.lead_id
-                    ORDER BY activity_at
-                    LIMIT 1
-                ) la2 ON true
+                LEFT JOIN (
+                    -- First activity per lead in one pass over
+                    -- ix_lead_activities_lead_id_at, not a probe per lead
+                    SELECT DISTINCT ON (lead_id) lead_id, activity_at
+                    FROM lead_activities
+                    ORDER BY lead_id, activity_at
+                ) la2 ON la2.lead_id = l.lead_id
                 GROUP BY a.agent_id, a.full_name
             )
             SELECT
@@ -107,43 +255,30 @@ class LeadAnalytics:
                 avg_response_hours
             FROM agent_stats
             WHERE leads_assigned > 0
-            ORDER BY conversion_rate DESC, average_deal_size DESC
+            ORDER BY conversion_rate DESC, average_deal_size DESC, agent_id
         """)
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(query)
-            return [dict(row) for row in result.mappings()]
+        return await LeadAnalytics._paginate(query, skip, limit, include_total)
 
     @staticmethod
-    async def get_revenue_attribution_by_lead_source() -> List[Dict[str, Any]]:
-        """Revenue attribution by lead source - using proper deal_value column"""
+    async def get_revenue_attribution_by_lead_source(skip: int = 0, limit: int = 100, include_total: bool = False) -> Dict[str, Any]:
+        """Revenue attribution by lead source - from mv_revenue_by_source"""
         query = text("""
-            SELECT
-                l.source_type,
-                COALESCE(SUM(lch.deal_value), 0) as total_revenue,
-                COUNT(DISTINCT l.lead_id) as converted_leads,
-                ROUND(AVG(lch.deal_value), 2) as average_deal_size
-            FROM leads l
-            JOIN lead_conversion_history lch ON l.lead_id = lch.lead_id
-            WHERE lch.status_to = 'converted'
-            AND lch.deal_value IS NOT NULL
-            GROUP BY l.source_type
-            ORDER BY total_revenue DESC
+            SELECT * FROM mv_revenue_by_source
+            ORDER BY total_revenue DESC, source_type
         """)
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(query)
-            return [dict(row) for row in result.mappings()]
+        return await LeadAnalytics._paginate(query, skip, limit, include_total)
 
     @staticmethod
-    async def get_high_scoring_leads_not_converted() -> List[Dict[str, Any]]:
+    async def get_high_scoring_leads_not_converted(skip: int = 0, limit: int = 100, include_total: bool = False) -> Dict[str, Any]:
         """High-scoring leads that didn't convert - identify patterns"""
         query = text("""
             SELECT
                 source_type,
                 nationality,
-                budget_min,
-                budget_max,
+                budget_min_fils / 100.0 as budget_min,
+                budget_max_fils / 100.0 as budget_max,
                 property_type,
                 COUNT(*) as lead_count,
                 ROUND(AVG(score), 2) as avg_score,
@@ -152,63 +287,50 @@ class LeadAnalytics:
             FROM leads
             WHERE score > 80
             AND status != 'converted'
-            GROUP BY source_type, nationality, budget_min, budget_max, property_type
-            ORDER BY lead_count DESC, avg_score DESC
+            GROUP BY source_type, nationality, budget_min_fils, budget_max_fils, property_type
+            ORDER BY lead_count DESC, avg_score DESC, source_type, nationality, budget_min_fils, budget_max_fils, property_type
         """)
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(query)
-            return [dict(row) for row in result.mappings()]
+        return await LeadAnalytics._paginate(query, skip, limit, include_total)
 
     @staticmethod
-    async def get_low_scoring_leads_converted() -> List[Dict[str, Any]]:
+    async def get_low_scoring_leads_converted(skip: int = 0, limit: int = 100, include_total: bool = False) -> Dict[str, Any]:
         """Low-scoring leads that converted - identify opportunities"""
         query = text("""
             SELECT
                 source_type,
                 nationality,
-                budget_min,
-                budget_max,
+                budget_min_fils / 100.0 as budget_min,
+                budget_max_fils / 100.0 as budget_max,
                 property_type,
                 COUNT(*) as lead_count,
                 ROUND(AVG(score), 2) as avg_score,
-                AVG(lch.deal_value) as avg_deal_value
+                AVG(lch.deal_value_fils) / 100.0 as avg_deal_value
             FROM leads l
             JOIN lead_conversion_history lch ON l.lead_id = lch.lead_id
             WHERE l.score < 50
             AND lch.status_to = 'converted'
-            GROUP BY source_type, nationality, budget_min, budget_max, property_type
-            ORDER BY lead_count DESC, avg_score DESC
+            GROUP BY source_type, nationality, budget_min_fils, budget_max_fils, property_type
+            ORDER BY lead_count DESC, avg_score DESC, source_type, nationality, budget_min_fils, budget_max_fils, property_type
         """)
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(query)
-            return [dict(row) for row in result.mappings()]
+        return await LeadAnalytics._paginate(query, skip, limit, include_total)
 
     @staticmethod
-    async def get_source_quality_comparison_over_time() -> List[Dict[str, Any]]:
-        """Source quality comparison over time"""
+    async def get_source_quality_comparison_over_time(skip: int = 0, limit: int = 100, include_total: bool = False) -> Dict[str, Any]:
+        """Source quality comparison over time - from mv_source_quality_monthly"""
         query = text("""
-            SELECT
-                source_type,
-                DATE_TRUNC('month', created_at) as month,
-                ROUND(AVG(score), 2) as avg_score,
-                COUNT(*) as lead_count,
-                COUNT(CASE WHEN status = 'converted' THEN 1 END) as converted_count
-            FROM leads
-            GROUP BY source_type, DATE_TRUNC('month', created_at)
+            SELECT * FROM mv_source_quality_monthly
             ORDER BY month DESC, source_type, avg_score DESC
         """)
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(query)
-            return [dict(row) for row in result.mappings()]
+        return await LeadAnalytics._paginate(query, skip, limit, include_total)
 
     @staticmethod
-    async def get_optimal_follow_up_timing_analysis() -> List[Dict[str, Any]]:
+    async def get_optimal_follow_up_timing_analysis(skip: int = 0, limit: int = 100, include_total: bool = False) -> Dict[str, Any]:
         """Optimal follow-up timing analysis - optimized CTE usage"""
         query = text("""
-            WITH activity_sequences AS (
+            WITH activity_sequences AS NOT MATERIALIZED (
                 SELECT
                     la.lead_id,
                     la.activity_at,
@@ -220,7 +342,7 @@ class LeadAnalytics:
                 JOIN leads l ON la.lead_id = l.lead_id
                 WHERE la.activity_at IS NOT NULL
             ),
-            timing_buckets AS (
+            timing_buckets AS NOT MATERIALIZED (
                 SELECT
                     CASE
                         WHEN EXTRACT(EPOCH FROM (next_activity_at - activity_at))/3600 <= 1 THEN '0-1 hours'
@@ -250,12 +372,10 @@ class LeadAnalytics:
                 END
         """)
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(query)
-            return [dict(row) for row in result.mappings()]
+        return await LeadAnalytics._paginate(query, skip, limit, include_total)
 
     @staticmethod
-    async def get_current_workload_distribution() -> List[Dict[str, Any]]:
+    async def get_current_workload_distribution(skip: int = 0, limit: int = 100, include_total: bool = False) -> Dict[str, Any]:
         """Current workload distribution"""
         query = text("""
             SELECT
@@ -265,15 +385,13 @@ class LeadAnalytics:
                 specialization_property_type,
                 specialization_areas
             FROM agents
-            ORDER BY active_leads_count DESC
+            ORDER BY active_leads_count DESC, agent_id
         """)
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(query)
-            return [dict(row) for row in result.mappings()]
+        return await LeadAnalytics._paginate(query, skip, limit, include_total)
 
     @staticmethod
-    async def get_agents_approaching_maximum_capacity() -> List[Dict[str, Any]]:
+    async def get_agents_approaching_maximum_capacity(skip: int = 0, limit: int = 100, include_total: bool = False) -> Dict[str, Any]:
         """Agents approaching maximum capacity - configurable threshold"""
         query = text("""
             SELECT
@@ -283,18 +401,16 @@ class LeadAnalytics:
                 50 - active_leads_count as remaining_capacity
             FROM agents
             WHERE active_leads_count > 40
-            ORDER BY active_leads_count DESC
+            ORDER BY active_leads_count DESC, agent_id
         """)
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(query)
-            return [dict(row) for row in result.mappings()]
+        return await LeadAnalytics._paginate(query, skip, limit, include_total)
 
     @staticmethod
-    async def get_specialized_vs_general_agent_performance() -> List[Dict[str, Any]]:
+    async def get_specialized_vs_general_agent_performance(skip: int = 0, limit: int = 100, include_total: bool = False) -> Dict[str, Any]:
         """Specialized vs general agent performance - dynamic calculation"""
         query = text("""
-            WITH agent_performance AS (
+            WITH agent_performance AS NOT MATERIALIZED (
                 SELECT
                     a.agent_id,
                     CASE
@@ -321,17 +437,16 @@ class LeadAnalytics:
             FROM agent_performance
             WHERE total_leads > 0
             GROUP BY agent_category
+            ORDER BY agent_category
         """)
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(query)
-            return [dict(row) for row in result.mappings()]
+        return await LeadAnalytics._paginate(query, skip, limit, include_total)
 
     @staticmethod
-    async def get_lead_response_time_correlation_with_conversion() -> List[Dict[str, Any]]:
+    async def get_lead_response_time_correlation_with_conversion(skip: int = 0, limit: int = 100, include_total: bool = False) -> Dict[str, Any]:
         """Lead response time correlation with conversion - dynamic calculation"""
         query = text("""
-            WITH response_times AS (
+            WITH response_times AS NOT MATERIALIZED (
                 SELECT
                     a.agent_id,
                     AVG(EXTRACT(EPOCH FROM (first_activity.activity_at - l.created_at))/3600) as avg_response_hours,
@@ -344,17 +459,17 @@ class LeadAnalytics:
                 FROM agents a
                 JOIN lead_assignments la ON a.agent_id = la.agent_id
                 JOIN leads l ON la.lead_id = l.lead_id
-                LEFT JOIN LATERAL (
-                    SELECT activity_at
-                    FROM lead_activities la_inner
-                    WHERE la_inner.lead_id = l.lead_id
-                    ORDER BY activity_at
-                    LIMIT 1
-                ) first_activity ON true
+                LEFT JOIN (
+                    -- First activity per lead in one pass over
+                    -- ix_lead_activities_lead_id_at, not a probe per lead
+                    SELECT DISTINCT ON (lead_id) lead_id, activity_at
+                    FROM lead_activities
+                    ORDER BY lead_id, activity_at
+                ) first_activity ON first_activity.lead_id = l.lead_id
                 GROUP BY a.agent_id
                 HAVING COUNT(la.lead_id) > 0
             ),
-            response_buckets AS (
+            response_buckets AS NOT MATERIALIZED (
                 SELECT
                     CASE
                         WHEN avg_response_hours < 1 THEN '< 1 hour'
@@ -385,8 +500,6 @@ class LeadAnalytics:
                 END
         """)
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(query)
-            return [dict(row) for row in result.mappings()]
+        return await LeadAnalytics._paginate(query, skip, limit, include_total)
 
    
\ No newline at end of file
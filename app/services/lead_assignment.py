@@ -1,17 +1,49 @@
 from typing import Dict, Any, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, func, values, column, Integer
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import raiseload
 from app.models.agent import Agent
 from app.models.assignment import LeadAssignment
 from app.models.lead import Lead
 from app.exceptions import AgentOverloadError
 from fastapi import HTTPException
 
+async def bulk_adjust_active_leads(deltas: Dict[UUID, int], db: AsyncSession) -> None:
+    """Apply per-agent active_leads_count deltas in one UPDATE ... FROM (VALUES ...)."""
+    deltas = {agent_id: delta for agent_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    if len(deltas) > 1:
+        # The UPDATE locks rows in whatever order its join plan visits them;
+        # take the locks in agent_id order first so concurrent batches over
+        # the same agents queue up instead of deadlocking
+        await db.execute(
+            select(Agent.agent_id)
+            .where(Agent.agent_id.in_(deltas))
+            .order_by(Agent.agent_id)
+            .with_for_update()
+        )
+    adjustments = values(
+        column("agent_id", PG_UUID(as_uuid=True)),
+        column("delta", Integer),
+        name="adjustments"
+    ).data(list(deltas.items()))
+    await db.execute(
+        update(Agent)
+        .where(Agent.agent_id == adjustments.c.agent_id)
+        .values(active_leads_count=Agent.active_leads_count + adjustments.c.delta)
+        .execution_options(synchronize_session=False)
+    )
+
+
 class LeadAssignmentManager:
     async def _find_best_agent(self, lead_data: Dict[str, Any], db: AsyncSession) -> Agent:
-        # Get available agents
-        result = await db.execute(select(Agent).where(Agent.active_leads_count < 50))
+        # Get available agents. Entity loads here use raiseload("*"): touching
+        # an unloaded relationship fails loudly at the access site instead of
+        # becoming a hidden per-row query.
+        result = await db.execute(select(Agent).options(raiseload("*")).where(Agent.active_leads_count < 50))
         agents = result.scalars().all()
         
         if not agents:
@@ -25,7 +57,8 @@ class LeadAssignmentManager:
         
         # Calculate match scores
         lead_property_type = lead_dict.get("property_type")
-        lead_areas = lead_dict.get("preferred_areas", [])
+        # Set once per lead so each agent's area match is a single C-level disjointness probe
+        lead_areas = frozenset(lead_dict.get("preferred_areas") or ())
         lead_language = lead_dict.get("language_preference")
         
         best_agent = None
@@ -35,7 +68,7 @@ class LeadAssignmentManager:
             score = 0
             if lead_property_type and lead_property_type in (agent.specialization_property_type or []):
                 score += 1
-            if any(area in (agent.specialization_areas or []) for area in lead_areas):
+            if agent.specialization_areas and not lead_areas.isdisjoint(agent.specialization_areas):
                 score += 1
             if lead_language and lead_language in (agent.language_skills or []):
                 score += 1
@@ -46,6 +79,20 @@ class LeadAssignmentManager:
         
         return best_agent
 
+    async def try_reserve_slot(self, agent_id: UUID, max_leads: int, db: AsyncSession) -> Optional[int]:
+        """Take one of the agent's lead slots; the new count, or None if full or missing.
+
+        Check and increment are one atomic UPDATE ... RETURNING, so there is no
+        read-then-write window for a concurrent capture to slip through.
+        """
+        return await db.scalar(
+            update(Agent)
+            .where(Agent.agent_id == agent_id, Agent.active_leads_count < max_leads)
+            .values(active_leads_count=Agent.active_leads_count + 1)
+            .returning(Agent.active_leads_count)
+            .execution_options(synchronize_session=False)
+        )
+
     async def assign_lead(self, lead_data: Dict[str, Any], db: AsyncSession) -> UUID:
         best_agent = await self._find_best_agent(lead_data, db)
         
@@ -54,7 +101,7 @@ class LeadAssignmentManager:
 
     async def reassign_lead(self, lead_id: UUID, reason: str, db: AsyncSession, new_agent_id: Optional[UUID] = None) -> UUID:
         # Get current assignment
-        result = await db.execute(select(LeadAssignment).where(LeadAssignment.lead_id == lead_id))
+        result = await db.execute(select(LeadAssignment).options(raiseload("*")).where(LeadAssignment.lead_id == lead_id))
         assignment = result.scalar_one_or_none()
         if not assignment:
             raise HTTPException(status_code=404, detail="Assignment not found")
@@ -63,7 +110,7 @@ class LeadAssignmentManager:
         
         if new_agent_id is None:
             # Auto assign
-            result = await db.execute(select(Lead).where(Lead.lead_id == lead_id))
+            result = await db.execute(select(Lead).options(raiseload("*")).where(Lead.lead_id == lead_id))
             lead = result.scalar_one()
             lead_data = {
                 "lead_id": lead.lead_id,
@@ -75,7 +122,7 @@ class LeadAssignmentManager:
             new_agent_id = new_agent.agent_id
         else:
             # Check new agent availability
-            result = await db.execute(select(Agent).where(Agent.agent_id == new_agent_id))
+            result = await db.execute(select(Agent).options(raiseload("*")).where(Agent.agent_id == new_agent_id))
             new_agent = result.scalar_one_or_none()
             if not new_agent or new_agent.active_leads_count >= 50:
                 raise AgentOverloadError()
@@ -85,9 +132,10 @@ class LeadAssignmentManager:
         assignment.reassigned_at = func.now()
         assignment.reason = reason
         
-        # Update counts
-        await db.execute(update(Agent).where(Agent.agent_id == old_agent_id).values(active_leads_count=Agent.active_leads_count - 1))
-        await db.execute(update(Agent).where(Agent.agent_id == new_agent_id).values(active_leads_count=Agent.active_leads_count + 1))
+        # Update counts (both agents in one statement)
+        deltas = {old_agent_id: -1}
+        deltas[new_agent_id] = deltas.get(new_agent_id, 0) + 1
+        await bulk_adjust_active_leads(deltas, db)
         await db.commit()
         
         return new_agent_id
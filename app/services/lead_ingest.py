@@ -0,0 +1,68 @@
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import TypeDecorator
+
+from app.models.lead import Lead
+
+
+def _default(column) -> Any:
+    default = column.default
+    return default.arg(None) if default.is_callable else default.arg
+
+
+async def copy_rows(model, rows: Sequence[Dict[str, Any]], db: AsyncSession) -> int:
+    """Load rows into model's table with one COPY instead of INSERT batches.
+
+    Rows are dicts keyed by ORM attribute name and must all share the first
+    row's keys. Client-side defaults (uuid7 primary keys, scalar defaults) are
+    written back into each dict so callers can read the generated ids; columns
+    left out entirely get their server defaults from COPY. ORM events do not
+    fire, so this is only for tables whose listeners don't apply on insert;
+    database triggers still do. Used by the seed script.
+
+    The COPY runs in a driver-level transaction block. Once the session has
+    executed a statement that block is a SAVEPOINT of the session's
+    transaction; if the COPY is the session's first statement it commits on
+    its own, so callers flush something first (as seed.py does).
+    """
+    if not rows:
+        return 0
+    dialect = db.get_bind().dialect
+    columns = [
+        (prop.key, prop.columns[0])
+        for prop in inspect(model).column_attrs
+        if prop.key in rows[0] or prop.columns[0].default is not None
+    ]
+
+    records: List[tuple] = []
+    for row in rows:
+        record = []
+        for key, column in columns:
+            if key not in row:
+                row[key] = _default(column)
+            value = row[key]
+            if isinstance(column.type, TypeDecorator):
+                # e.g. Money: AED Decimal -> fils
+                value = column.type.process_bind_param(value, dialect)
+            record.append(value)
+        records.append(tuple(record))
+
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+    # The asyncpg adapter defers BEGIN to its first statement, so open the
+    # transaction on the driver: a SAVEPOINT in the session's transaction
+    async with driver.transaction():
+        await driver.copy_records_to_table(
+            model.__tablename__,
+            records=records,
+            columns=[column.name for _, column in columns],
+        )
+    return len(records)
+
+
+async def bulk_copy_leads(rows: Sequence[Dict[str, Any]], db: AsyncSession) -> int:
+    """COPY a batch of leads; each row dict gets its lead_id filled in."""
+    return await copy_rows(Lead, rows, db)
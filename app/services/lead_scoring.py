@@ -1,12 +1,41 @@
 from typing import Dict, Any
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import update, select
+from sqlalchemy import update
 from app.models.lead import Lead
 from app.models.activity import LeadActivity
 from sqlalchemy.sql import func
 from datetime import datetime, timedelta
 
+# Scoring rules, flattened into lookup tables once at import instead of being
+# rebuilt on every capture.
+BUDGET_TIERS = (  # (budget_max above, points), highest first
+    (10000000, 20),
+    (5000000, 15),
+    (2000000, 10),
+)
+BUDGET_BASE_POINTS = 5
+
+SOURCE_SCORES = {
+    "bayut": 90,
+    "propertyfinder": 85,
+    "website": 80,
+    "dubizzle": 75,
+    "walk_in": 70,
+    "referral": 95
+}
+DEFAULT_SOURCE_SCORE = 50
+
+GCC_NATIONALITIES = ("saudi", "kuwait", "bahrain", "qatar", "oman")
+
+ACTIVITY_TYPE_ADJUSTMENTS = {
+    "viewing": 10,
+    "offer_made": 20,
+    "no_response": -10,
+}
+POSITIVE_OUTCOME_BONUS = 5
+
+
 class LeadScoringEngine:
     async def calculate_lead_score(self, lead_data: Dict[str, Any], source_details: Dict[str, Any], db: AsyncSession) -> int:
         score = 0
@@ -14,32 +43,17 @@ class LeadScoringEngine:
         # Budget range
         budget_max = lead_data.get("budget_max")
         if budget_max:
-            if budget_max > 10000000:
-                score += 20
-            elif budget_max > 5000000:
-                score += 15
-            elif budget_max > 2000000:
-                score += 10
-            else:
-                score += 5
+            score += next((points for floor, points in BUDGET_TIERS if budget_max > floor), BUDGET_BASE_POINTS)
         
         # Source quality
         source_type = source_details.get("source_type", "").lower()
-        source_scores = {
-            "bayut": 90,
-            "propertyfinder": 85,
-            "website": 80,
-            "dubizzle": 75,
-            "walk_in": 70,
-            "referral": 95
-        }
-        score += source_scores.get(source_type, 50)
+        score += SOURCE_SCORES.get(source_type, DEFAULT_SOURCE_SCORE)
         
         # Nationality
-        nationality = lead_data.get("nationality", "").lower()
+        nationality = (lead_data.get("nationality") or "").lower()
         if "uae" in nationality or "emirati" in nationality:
             score += 10
-        elif any(gcc in nationality for gcc in ["saudi", "kuwait", "bahrain", "qatar", "oman"]):
+        elif any(gcc in nationality for gcc in GCC_NATIONALITIES):
             score += 5
         
         # Property type preference
@@ -57,25 +71,15 @@ class LeadScoringEngine:
         return min(100, max(0, score))
 
     async def update_lead_score(self, lead_id: UUID, activity_data: Dict[str, Any], db: AsyncSession) -> int:
-        # Get current score
-        result = await db.execute(select(Lead.score).where(Lead.lead_id == lead_id))
-        current_score = result.scalar_one()
-        
-        adjustment = 0
-        activity_type = activity_data.get("type")
-        outcome = activity_data.get("outcome")
-        
-        if outcome == "positive":
-            adjustment += 5
-        if activity_type == "viewing":
-            adjustment += 10
-        if activity_type == "offer_made":
-            adjustment += 20
-        if activity_type == "no_response":
-            adjustment -= 10
-        
-        new_score = min(100, max(0, current_score + adjustment))
-        
-        await db.execute(update(Lead).where(Lead.lead_id == lead_id).values(score=new_score))
-        
-        return new_score
+        adjustment = ACTIVITY_TYPE_ADJUSTMENTS.get(activity_data.get("type"), 0)
+        if activity_data.get("outcome") == "positive":
+            adjustment += POSITIVE_OUTCOME_BONUS
+
+        # Clamp and apply in Postgres: one UPDATE ... RETURNING instead of a
+        # SELECT of the current score followed by the UPDATE
+        return await db.scalar(
+            update(Lead)
+            .where(Lead.lead_id == lead_id)
+            .values(score=func.least(100, func.greatest(0, Lead.score + adjustment)))
+            .returning(Lead.score)
+        )